@@ -63,8 +63,10 @@ class KeywordAnalyzer:
         # Initialize stemmers and lemmatizers
         self._initialize_processors()
         
-        # Industry-specific keyword sets
-        self.industry_keywords = DEFAULT_KEYWORDS
+        # Industry-specific keyword sets (copied so custom keywords stay per-instance)
+        self.industry_keywords = {
+            industry: list(keywords) for industry, keywords in DEFAULT_KEYWORDS.items()
+        }
     
     def _initialize_nlp(self):
         """Initialize NLP components (NLTK and/or spaCy)."""
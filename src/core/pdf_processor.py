@@ -104,7 +104,7 @@ class PDFProcessor:
         if file_path.suffix.lower() not in SUPPORTED_RESUME_FORMATS:
             raise ValueError(
                 ERROR_MESSAGES["invalid_file_format"].format(
-                    ", ".join(SUPPORTED_RESUME_FORMATS)
+                    ", ".join(sorted(SUPPORTED_RESUME_FORMATS))
                 )
             )
         
@@ -7,9 +7,12 @@ Contains all PySide6-based user interface components for the EasyApply applicati
 from .main_window import MainWindow
 from .widgets import (
     FileUploadWidget, KeywordTableWidget, ResultsWidget,
-    InfographicWidget, SettingsWidget, StatusWidget
+    InfographicWidget, SettingsWidget, StatusWidget, LazyWidget
+)
+from .styles import (
+    get_application_style, get_style_delta, get_dark_theme_style, get_compact_style,
+    get_font
 )
-from .styles import get_application_style, get_dark_theme_style, get_compact_style
 
 __all__ = [
     'MainWindow',
@@ -19,7 +22,10 @@ __all__ = [
     'InfographicWidget', 
     'SettingsWidget', 
     'StatusWidget',
+    'LazyWidget',
     'get_application_style',
+    'get_style_delta',
     'get_dark_theme_style',
-    'get_compact_style'
+    'get_compact_style',
+    'get_font'
 ]
\ No newline at end of file
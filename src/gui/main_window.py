@@ -28,9 +28,9 @@ from PySide6.QtGui import (
 
 from src.gui.widgets import (
     FileUploadWidget, KeywordTableWidget, ResultsWidget,
-    InfographicWidget, SettingsWidget, StatusWidget
+    InfographicWidget, SettingsWidget, StatusWidget, LazyWidget
 )
-from src.gui.styles import get_application_style
+from src.gui.styles import get_application_style, get_font, LABEL_FONT_SIZE
 from src.core.pdf_processor import PDFProcessor
 from src.core.keyword_analyzer import KeywordAnalyzer
 from src.core.matcher import KeywordMatcher
@@ -279,26 +279,36 @@ class MainWindow(QMainWindow):
         # Create tab widget
         self.results_tabs = QTabWidget()
         
-        # Overview tab
+        # Overview tab (shown first, so built up front)
         self.overview_widget = InfographicWidget()
         self.results_tabs.addTab(self.overview_widget, "Overview")
         
+        # The remaining tabs are built the first time they are opened
+        
         # Keywords tab
-        self.keywords_widget = KeywordTableWidget()
+        self.keywords_widget = LazyWidget(KeywordTableWidget)
         self.results_tabs.addTab(self.keywords_widget, "Keywords")
         
         # Detailed results tab
-        self.detailed_widget = ResultsWidget()
+        self.detailed_widget = LazyWidget(ResultsWidget)
         self.results_tabs.addTab(self.detailed_widget, "Detailed Analysis")
         
         # Settings tab
-        self.settings_widget = SettingsWidget()
+        self.settings_widget = LazyWidget(SettingsWidget)
         self.results_tabs.addTab(self.settings_widget, "Settings")
         
+        self.results_tabs.currentChanged.connect(self._ensure_tab_built)
+        
         results_layout.addWidget(self.results_tabs)
         
         parent.addWidget(results_widget)
     
+    def _ensure_tab_built(self, index: int):
+        """Build a lazily constructed results tab when it is first shown."""
+        widget = self.results_tabs.widget(index)
+        if isinstance(widget, LazyWidget):
+            widget.ensure_built()
+    
     def _setup_menu(self):
         """Set up the application menu bar."""
         menubar = self.menuBar()
@@ -378,12 +388,13 @@ class MainWindow(QMainWindow):
     
     def _apply_styles(self):
         """Apply application-wide styles."""
+        QApplication.setFont(get_font(LABEL_FONT_SIZE), "QLabel")
         self.setStyleSheet(get_application_style())
     
     def _connect_signals(self):
         """Connect all signal handlers."""
         # File upload signals
-        self.file_upload_widget.file_selected.connect(self._on_file_selected)
+        self.file_upload_widget.files_selected.connect(self._on_files_selected)
         
         # Analysis button
         self.analyze_button.clicked.connect(self._start_analysis)
@@ -391,10 +402,13 @@ class MainWindow(QMainWindow):
         # Job description changes
         self.job_description_edit.textChanged.connect(self._on_job_description_changed)
     
-    def _on_file_selected(self, file_path: str):
+    def _on_files_selected(self, file_paths: List[str]):
         """Handle file selection from upload widget."""
-        self.logger.info(f"File selected: {file_path}")
-        self.status_label.setText(f"Resume loaded: {Path(file_path).name}")
+        self.logger.info(f"Files selected: {file_paths}")
+        status = f"Resume loaded: {Path(file_paths[0]).name}"
+        if len(file_paths) > 1:
+            status += f" (+{len(file_paths) - 1} more)"
+        self.status_label.setText(status)
         self._update_analyze_button()
     
     def _on_job_description_changed(self):
@@ -533,16 +547,21 @@ class MainWindow(QMainWindow):
     
     def dragEnterEvent(self, event: QDragEnterEvent):
         """Handle drag enter events for file dropping."""
-        if event.mimeData().hasUrls():
+        # Same rule as FileUploadWidget: accept only drags dropEvent can use
+        urls = event.mimeData().urls()
+        if any(url.toLocalFile().lower().endswith('.pdf') for url in urls):
             event.acceptProposedAction()
+        else:
+            event.ignore()
     
     def dropEvent(self, event: QDropEvent):
         """Handle drop events for file dropping."""
-        urls = event.mimeData().urls()
-        if urls:
-            file_path = urls[0].toLocalFile()
-            if file_path.lower().endswith('.pdf'):
-                self.file_upload_widget.set_file(file_path)
+        pdf_paths = [
+            url.toLocalFile() for url in event.mimeData().urls()
+            if url.toLocalFile().lower().endswith('.pdf')
+        ]
+        if pdf_paths:
+            self.file_upload_widget.set_files(pdf_paths)
     
     def closeEvent(self, event):
         """Handle application close event."""
@@ -5,27 +5,34 @@ Contains all styling definitions for the EasyApply application,
 providing a modern, professional appearance across all components.
 """
 
+import re
+import sys
+from functools import lru_cache
+from string import Formatter
+from typing import Dict, List, Optional
+
+from PySide6.QtGui import QFont
+
 from src.utils.constants import COLORS
 
+# Default pixel size for QLabel text, applied as a class font by MainWindow
+LABEL_FONT_SIZE = 13
 
-def get_application_style() -> str:
-    """
-    Get the complete application stylesheet.
-    
-    Returns:
-        str: Complete CSS stylesheet for the application
-    """
-    return f"""
+
+# Matches one "selector {{ ... }}" rule, including any comment above it
+_RULE_BLOCK_PATTERN = re.compile(r'[^{}]*\{\{(?:[^{}]|\{\w+\})*\}\}')
+
+_APPLICATION_TEMPLATE = """
     /* Main Application Styles */
     QMainWindow {{
-        background-color: {COLORS['light']};
-        color: {COLORS['dark']};
+        background-color: {light};
+        color: {dark};
     }}
     
     /* Menu Bar */
     QMenuBar {{
-        background-color: {COLORS['white']};
-        border-bottom: 1px solid {COLORS['light_gray']};
+        background-color: {white};
+        border-bottom: 1px solid {light_gray};
         padding: 5px;
     }}
     
@@ -36,13 +43,13 @@ def get_application_style() -> str:
     }}
     
     QMenuBar::item:selected {{
-        background-color: {COLORS['primary']};
-        color: {COLORS['white']};
+        background-color: {primary};
+        color: {white};
     }}
     
     QMenu {{
-        background-color: {COLORS['white']};
-        border: 1px solid {COLORS['light_gray']};
+        background-color: {white};
+        border: 1px solid {light_gray};
         border-radius: 6px;
         padding: 5px;
     }}
@@ -53,53 +60,53 @@ def get_application_style() -> str:
     }}
     
     QMenu::item:selected {{
-        background-color: {COLORS['primary']};
-        color: {COLORS['white']};
+        background-color: {primary};
+        color: {white};
     }}
     
     /* Toolbar */
     QToolBar {{
-        background-color: {COLORS['white']};
-        border-bottom: 1px solid {COLORS['light_gray']};
+        background-color: {white};
+        border-bottom: 1px solid {light_gray};
         spacing: 5px;
         padding: 5px;
     }}
     
     QToolBar::separator {{
-        background-color: {COLORS['light_gray']};
+        background-color: {light_gray};
         width: 1px;
         margin: 5px;
     }}
     
     /* Status Bar */
     QStatusBar {{
-        background-color: {COLORS['white']};
-        border-top: 1px solid {COLORS['light_gray']};
+        background-color: {white};
+        border-top: 1px solid {light_gray};
         padding: 5px;
     }}
     
     /* Group Boxes */
     QGroupBox {{
         font-weight: bold;
-        border: 2px solid {COLORS['light_gray']};
+        border: 2px solid {light_gray};
         border-radius: 8px;
         margin-top: 10px;
         padding-top: 10px;
-        background-color: {COLORS['white']};
+        background-color: {white};
     }}
     
     QGroupBox::title {{
         subcontrol-origin: margin;
         left: 10px;
         padding: 0 8px 0 8px;
-        color: {COLORS['primary']};
+        color: {primary};
         font-size: 14px;
     }}
     
     /* Buttons */
     QPushButton {{
-        background-color: {COLORS['primary']};
-        color: {COLORS['white']};
+        background-color: {primary};
+        color: {white};
         border: none;
         border-radius: 6px;
         padding: 10px 20px;
@@ -108,33 +115,33 @@ def get_application_style() -> str:
     }}
     
     QPushButton:hover {{
-        background-color: {COLORS['secondary']};
+        background-color: {secondary};
     }}
     
     QPushButton:pressed {{
-        background-color: {COLORS['dark']};
+        background-color: {dark};
     }}
     
     QPushButton:disabled {{
-        background-color: {COLORS['gray']};
-        color: {COLORS['light_gray']};
+        background-color: {gray};
+        color: {light_gray};
     }}
     
     /* Secondary Button Style */
     QPushButton[class="secondary"] {{
-        background-color: {COLORS['light_gray']};
-        color: {COLORS['dark']};
-        border: 1px solid {COLORS['gray']};
+        background-color: {light_gray};
+        color: {dark};
+        border: 1px solid {gray};
     }}
     
     QPushButton[class="secondary"]:hover {{
-        background-color: {COLORS['gray']};
-        color: {COLORS['white']};
+        background-color: {gray};
+        color: {white};
     }}
     
     /* Success Button Style */
     QPushButton[class="success"] {{
-        background-color: {COLORS['success']};
+        background-color: {success};
     }}
     
     QPushButton[class="success"]:hover {{
@@ -143,8 +150,8 @@ def get_application_style() -> str:
     
     /* Warning Button Style */
     QPushButton[class="warning"] {{
-        background-color: {COLORS['warning']};
-        color: {COLORS['dark']};
+        background-color: {warning};
+        color: {dark};
     }}
     
     QPushButton[class="warning"]:hover {{
@@ -153,7 +160,7 @@ def get_application_style() -> str:
     
     /* Danger Button Style */
     QPushButton[class="danger"] {{
-        background-color: {COLORS['danger']};
+        background-color: {danger};
     }}
     
     QPushButton[class="danger"]:hover {{
@@ -162,35 +169,35 @@ def get_application_style() -> str:
     
     /* Text Inputs */
     QTextEdit, QPlainTextEdit {{
-        background-color: {COLORS['white']};
-        border: 2px solid {COLORS['light_gray']};
+        background-color: {white};
+        border: 2px solid {light_gray};
         border-radius: 6px;
         padding: 8px;
         font-size: 13px;
-        selection-background-color: {COLORS['primary']};
+        selection-background-color: {primary};
     }}
     
     QTextEdit:focus, QPlainTextEdit:focus {{
-        border-color: {COLORS['primary']};
+        border-color: {primary};
     }}
     
     QLineEdit {{
-        background-color: {COLORS['white']};
-        border: 2px solid {COLORS['light_gray']};
+        background-color: {white};
+        border: 2px solid {light_gray};
         border-radius: 6px;
         padding: 8px 12px;
         font-size: 13px;
-        selection-background-color: {COLORS['primary']};
+        selection-background-color: {primary};
     }}
     
     QLineEdit:focus {{
-        border-color: {COLORS['primary']};
+        border-color: {primary};
     }}
     
     /* Combo Boxes */
     QComboBox {{
-        background-color: {COLORS['white']};
-        border: 2px solid {COLORS['light_gray']};
+        background-color: {white};
+        border: 2px solid {light_gray};
         border-radius: 6px;
         padding: 8px 12px;
         font-size: 13px;
@@ -198,7 +205,7 @@ def get_application_style() -> str:
     }}
     
     QComboBox:focus {{
-        border-color: {COLORS['primary']};
+        border-color: {primary};
     }}
     
     QComboBox::drop-down {{
@@ -210,38 +217,38 @@ def get_application_style() -> str:
         image: none;
         border-left: 5px solid transparent;
         border-right: 5px solid transparent;
-        border-top: 5px solid {COLORS['gray']};
+        border-top: 5px solid {gray};
         margin-right: 5px;
     }}
     
     QComboBox::down-arrow:on {{
-        border-top-color: {COLORS['primary']};
+        border-top-color: {primary};
     }}
     
     QComboBox QAbstractItemView {{
-        background-color: {COLORS['white']};
-        border: 1px solid {COLORS['light_gray']};
+        background-color: {white};
+        border: 1px solid {light_gray};
         border-radius: 6px;
-        selection-background-color: {COLORS['primary']};
-        selection-color: {COLORS['white']};
+        selection-background-color: {primary};
+        selection-color: {white};
     }}
     
     /* Spin Boxes */
     QSpinBox, QDoubleSpinBox {{
-        background-color: {COLORS['white']};
-        border: 2px solid {COLORS['light_gray']};
+        background-color: {white};
+        border: 2px solid {light_gray};
         border-radius: 6px;
         padding: 8px 12px;
         font-size: 13px;
     }}
     
     QSpinBox:focus, QDoubleSpinBox:focus {{
-        border-color: {COLORS['primary']};
+        border-color: {primary};
     }}
     
     QSpinBox::up-button, QDoubleSpinBox::up-button,
     QSpinBox::down-button, QDoubleSpinBox::down-button {{
-        background-color: {COLORS['light_gray']};
+        background-color: {light_gray};
         border: none;
         border-radius: 3px;
         margin: 2px;
@@ -249,7 +256,7 @@ def get_application_style() -> str:
     
     QSpinBox::up-button:hover, QDoubleSpinBox::up-button:hover,
     QSpinBox::down-button:hover, QDoubleSpinBox::down-button:hover {{
-        background-color: {COLORS['gray']};
+        background-color: {gray};
     }}
     
     /* Check Boxes */
@@ -261,33 +268,33 @@ def get_application_style() -> str:
     QCheckBox::indicator {{
         width: 18px;
         height: 18px;
-        border: 2px solid {COLORS['gray']};
+        border: 2px solid {gray};
         border-radius: 4px;
-        background-color: {COLORS['white']};
+        background-color: {white};
     }}
     
     QCheckBox::indicator:checked {{
-        background-color: {COLORS['primary']};
-        border-color: {COLORS['primary']};
+        background-color: {primary};
+        border-color: {primary};
         image: url(data:image/svg+xml;base64,PHN2ZyB3aWR0aD0iMTIiIGhlaWdodD0iMTIiIHZpZXdCb3g9IjAgMCAxMiAxMiIgZmlsbD0ibm9uZSIgeG1sbnM9Imh0dHA6Ly93d3cudzMub3JnLzIwMDAvc3ZnIj4KPHBhdGggZD0iTTEwIDNMNC41IDguNUwyIDYiIHN0cm9rZT0id2hpdGUiIHN0cm9rZS13aWR0aD0iMiIgc3Ryb2tlLWxpbmVjYXA9InJvdW5kIiBzdHJva2UtbGluZWpvaW49InJvdW5kIi8+Cjwvc3ZnPgo=);
     }}
     
     QCheckBox::indicator:hover {{
-        border-color: {COLORS['primary']};
+        border-color: {primary};
     }}
     
     /* Sliders */
     QSlider::groove:horizontal {{
-        border: 1px solid {COLORS['light_gray']};
+        border: 1px solid {light_gray};
         height: 8px;
-        background-color: {COLORS['light_gray']};
+        background-color: {light_gray};
         border-radius: 4px;
         margin: 2px 0;
     }}
     
     QSlider::handle:horizontal {{
-        background-color: {COLORS['primary']};
-        border: 2px solid {COLORS['primary']};
+        background-color: {primary};
+        border: 2px solid {primary};
         width: 18px;
         height: 18px;
         border-radius: 9px;
@@ -295,73 +302,73 @@ def get_application_style() -> str:
     }}
     
     QSlider::handle:horizontal:hover {{
-        background-color: {COLORS['secondary']};
-        border-color: {COLORS['secondary']};
+        background-color: {secondary};
+        border-color: {secondary};
     }}
     
     QSlider::sub-page:horizontal {{
-        background-color: {COLORS['primary']};
+        background-color: {primary};
         border-radius: 4px;
     }}
     
     /* Progress Bars */
     QProgressBar {{
-        border: 1px solid {COLORS['light_gray']};
+        border: 1px solid {light_gray};
         border-radius: 6px;
         text-align: center;
-        background-color: {COLORS['light_gray']};
+        background-color: {light_gray};
         font-weight: bold;
     }}
     
     QProgressBar::chunk {{
-        background-color: {COLORS['primary']};
+        background-color: {primary};
         border-radius: 5px;
     }}
     
     /* Tables */
-    QTableWidget {{
-        background-color: {COLORS['white']};
-        border: 1px solid {COLORS['light_gray']};
+    QTableView {{
+        background-color: {white};
+        border: 1px solid {light_gray};
         border-radius: 6px;
-        gridline-color: {COLORS['light_gray']};
-        selection-background-color: {COLORS['primary']};
-        selection-color: {COLORS['white']};
+        gridline-color: {light_gray};
+        selection-background-color: {primary};
+        selection-color: {white};
     }}
     
-    QTableWidget::item {{
+    QTableView::item {{
         padding: 8px;
         border: none;
     }}
     
-    QTableWidget::item:selected {{
-        background-color: {COLORS['primary']};
-        color: {COLORS['white']};
+    QTableView::item:selected {{
+        background-color: {primary};
+        color: {white};
     }}
     
     QHeaderView::section {{
-        background-color: {COLORS['light_gray']};
+        background-color: {light_gray};
         padding: 8px;
         border: none;
-        border-right: 1px solid {COLORS['gray']};
-        border-bottom: 1px solid {COLORS['gray']};
+        border-right: 1px solid {gray};
+        border-bottom: 1px solid {gray};
         font-weight: bold;
     }}
     
     QHeaderView::section:hover {{
-        background-color: {COLORS['gray']};
-        color: {COLORS['white']};
+        background-color: {gray};
+        color: {white};
     }}
     
     /* Tab Widgets */
     QTabWidget::pane {{
-        border: 1px solid {COLORS['light_gray']};
+        border: 1px solid {light_gray};
         border-radius: 6px;
-        background-color: {COLORS['white']};
+        background-color: {white};
     }}
     
     QTabBar::tab {{
-        background-color: {COLORS['light_gray']};
-        color: {COLORS['dark']};
+        background-color: {light_gray};
+        color: {dark};
         padding: 10px 20px;
         margin-right: 2px;
         border-top-left-radius: 6px;
@@ -370,19 +377,19 @@ def get_application_style() -> str:
     }}
     
     QTabBar::tab:selected {{
-        background-color: {COLORS['primary']};
-        color: {COLORS['white']};
+        background-color: {primary};
+        color: {white};
     }}
     
     QTabBar::tab:hover:!selected {{
-        background-color: {COLORS['gray']};
-        color: {COLORS['white']};
+        background-color: {gray};
+        color: {white};
     }}
     
     /* List Widgets */
     QListWidget {{
-        background-color: {COLORS['white']};
-        border: 1px solid {COLORS['light_gray']};
+        background-color: {white};
+        border: 1px solid {light_gray};
         border-radius: 6px;
         padding: 5px;
     }}
@@ -394,36 +401,36 @@ def get_application_style() -> str:
     }}
     
     QListWidget::item:selected {{
-        background-color: {COLORS['primary']};
-        color: {COLORS['white']};
+        background-color: {primary};
+        color: {white};
     }}
     
     QListWidget::item:hover:!selected {{
-        background-color: {COLORS['light_gray']};
+        background-color: {light_gray};
     }}
     
     /* Scroll Areas */
     QScrollArea {{
-        border: 1px solid {COLORS['light_gray']};
+        border: 1px solid {light_gray};
         border-radius: 6px;
-        background-color: {COLORS['white']};
+        background-color: {white};
     }}
     
     /* Scroll Bars */
     QScrollBar:vertical {{
-        background-color: {COLORS['light_gray']};
+        background-color: {light_gray};
         width: 12px;
         border-radius: 6px;
     }}
     
     QScrollBar::handle:vertical {{
-        background-color: {COLORS['gray']};
+        background-color: {gray};
         border-radius: 6px;
         min-height: 20px;
     }}
     
     QScrollBar::handle:vertical:hover {{
-        background-color: {COLORS['primary']};
+        background-color: {primary};
     }}
     
     QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{
@@ -431,19 +438,19 @@ def get_application_style() -> str:
     }}
     
     QScrollBar:horizontal {{
-        background-color: {COLORS['light_gray']};
+        background-color: {light_gray};
         height: 12px;
         border-radius: 6px;
     }}
     
     QScrollBar::handle:horizontal {{
-        background-color: {COLORS['gray']};
+        background-color: {gray};
         border-radius: 6px;
         min-width: 20px;
     }}
     
     QScrollBar::handle:horizontal:hover {{
-        background-color: {COLORS['primary']};
+        background-color: {primary};
     }}
     
     QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal {{
@@ -452,7 +459,7 @@ def get_application_style() -> str:
     
     /* Splitter */
     QSplitter::handle {{
-        background-color: {COLORS['light_gray']};
+        background-color: {light_gray};
     }}
     
     QSplitter::handle:horizontal {{
@@ -464,56 +471,55 @@ def get_application_style() -> str:
     }}
     
     QSplitter::handle:hover {{
-        background-color: {COLORS['primary']};
+        background-color: {primary};
     }}
     
-    /* Labels */
+    /* Labels (default size comes from get_font(LABEL_FONT_SIZE)) */
     QLabel {{
-        color: {COLORS['dark']};
-        font-size: 13px;
+        color: {dark};
     }}
     
     QLabel[class="title"] {{
         font-size: 18px;
         font-weight: bold;
-        color: {COLORS['primary']};
+        color: {primary};
     }}
     
     QLabel[class="subtitle"] {{
         font-size: 14px;
         font-weight: bold;
-        color: {COLORS['secondary']};
+        color: {secondary};
     }}
     
     QLabel[class="success"] {{
-        color: {COLORS['success']};
+        color: {success};
     }}
     
     QLabel[class="warning"] {{
-        color: {COLORS['warning']};
+        color: {warning};
     }}
     
     QLabel[class="danger"] {{
-        color: {COLORS['danger']};
+        color: {danger};
     }}
     
     QLabel[class="info"] {{
-        color: {COLORS['info']};
+        color: {info};
     }}
     
     /* Frames */
     QFrame {{
-        background-color: {COLORS['white']};
+        background-color: {white};
     }}
     
     QFrame[class="separator"] {{
-        background-color: {COLORS['light_gray']};
+        background-color: {light_gray};
         max-height: 1px;
     }}
     
     /* Message Boxes */
     QMessageBox {{
-        background-color: {COLORS['white']};
+        background-color: {white};
     }}
     
     QMessageBox QPushButton {{
@@ -523,20 +529,20 @@ def get_application_style() -> str:
     
     /* File Dialog */
     QFileDialog {{
-        background-color: {COLORS['white']};
+        background-color: {white};
     }}
     
     QFileDialog QListView, QFileDialog QTreeView {{
-        background-color: {COLORS['white']};
-        border: 1px solid {COLORS['light_gray']};
+        background-color: {white};
+        border: 1px solid {light_gray};
         border-radius: 6px;
     }}
     
     /* Tool Tips */
     QToolTip {{
-        background-color: {COLORS['dark']};
-        color: {COLORS['white']};
-        border: 1px solid {COLORS['dark']};
+        background-color: {dark};
+        color: {white};
+        border: 1px solid {dark};
         border-radius: 4px;
         padding: 5px;
         font-size: 12px;
@@ -544,7 +550,7 @@ def get_application_style() -> str:
     
     /* Focus Indicators */
     *:focus {{
-        outline: 2px solid {COLORS['primary']};
+        outline: 2px solid {primary};
         outline-offset: 2px;
     }}
     
@@ -554,10 +560,97 @@ def get_application_style() -> str:
     }}
     """
 
+# Individual rule blocks of the application template, in source order
+_RULE_BLOCKS = _RULE_BLOCK_PATTERN.findall(_APPLICATION_TEMPLATE)
 
-def get_dark_theme_style() -> str:
+
+def _index_rules_by_color(blocks: List[str]) -> Dict[str, List[int]]:
+    """Build an inverted index of color key -> indices of the blocks using it."""
+    index = {}
+    for i, block in enumerate(blocks):
+        for key in {field for _, field, _, _ in Formatter().parse(block) if field}:
+            index.setdefault(key, []).append(i)
+    return index
+
+
+_RULES_BY_COLOR = _index_rules_by_color(_RULE_BLOCKS)
+
+
+def _merge_palette(palette: Optional[Dict[str, str]]) -> Dict[str, str]:
+    """Fill in any colors missing from a palette with the defaults."""
+    if not palette:
+        return COLORS
+    return {**COLORS, **palette}
+
+
+def get_application_style(palette: Optional[Dict[str, str]] = None) -> str:
     """
-    Get the dark theme stylesheet.
+    Get the complete application stylesheet.
+    
+    Args:
+        palette (Dict[str, str], optional): Color overrides keyed like COLORS
+        
+    Returns:
+        str: Complete CSS stylesheet for the application. The default-palette
+        stylesheet is built once and interned, so callers may compare two
+        results with ``is``.
+    """
+    if not palette:
+        return _STYLE_CACHE['app']
+    return _APPLICATION_TEMPLATE.format_map(_merge_palette(palette))
+
+
+@lru_cache(maxsize=None)
+def get_font(pixel_size: int, bold: bool = False) -> QFont:
+    """
+    Get a shared font for label typography.
+    
+    Setting fonts directly avoids resolving font-size/font-weight through
+    the stylesheet on every polish. Must be called after QApplication exists.
+    
+    Args:
+        pixel_size (int): Font size in pixels
+        bold (bool): Whether the font is bold
+        
+    Returns:
+        QFont: Cached font instance (setFont copies it, so it is safe to share)
+    """
+    font = QFont()
+    font.setPixelSize(pixel_size)
+    font.setBold(bold)
+    return font
+
+
+def get_style_delta(old_palette: Dict[str, str], new_palette: Dict[str, str]) -> str:
+    """
+    Get only the stylesheet rules affected by a palette change.
+    
+    Rules whose colors did not change are skipped, so appending the delta
+    to the current stylesheet keeps Qt from reparsing the whole sheet when
+    only one or two colors are adjusted.
+    
+    Args:
+        old_palette (Dict[str, str]): Palette the current stylesheet was built from
+        new_palette (Dict[str, str]): Palette to switch to
+        
+    Returns:
+        str: CSS containing only the rule blocks that reference changed colors
+    """
+    old_colors = _merge_palette(old_palette)
+    new_colors = _merge_palette(new_palette)
+    
+    affected = set()
+    for key, block_indices in _RULES_BY_COLOR.items():
+        if old_colors.get(key) != new_colors.get(key):
+            affected.update(block_indices)
+    
+    # Keep the original rule order so the cascade resolves the same way
+    return "".join(_RULE_BLOCKS[i].format_map(new_colors) for i in sorted(affected))
+
+
+def _build_dark_theme_style() -> str:
+    """
+    Build the dark theme stylesheet.
     
     Returns:
         str: Dark theme CSS stylesheet
@@ -608,7 +701,7 @@ def get_dark_theme_style() -> str:
         color: {dark_colors['text']};
     }}
     
-    QTableWidget, QListWidget {{
+    QTableView, QListWidget {{
         background-color: {dark_colors['surface']};
         border-color: {dark_colors['border']};
         color: {dark_colors['text']};
@@ -650,9 +743,12 @@ def get_dark_theme_style() -> str:
     """
 
 
-def get_compact_style() -> str:
+def _build_compact_style() -> str:
     """
-    Get a compact stylesheet for smaller screens.
+    Build a compact stylesheet for smaller screens.
+    
+    Label sizes are not set here: a QLabel font-size rule would override the
+    fonts widgets set with setFont().
     
     Returns:
         str: Compact CSS stylesheet
@@ -683,7 +779,7 @@ def get_compact_style() -> str:
         font-size: 12px;
     }}
     
-    QTableWidget::item {{
+    QTableView::item {{
         padding: 4px;
     }}
     
@@ -696,8 +792,33 @@ def get_compact_style() -> str:
         padding: 6px 12px;
         font-size: 12px;
     }}
+    """
+
+
+# Stylesheets are built once at import and interned so that callers comparing
+# the current and proposed stylesheet can short-circuit on identity
+_STYLE_CACHE = {
+    'app': sys.intern(_APPLICATION_TEMPLATE.format_map(COLORS)),
+    'dark': sys.intern(_build_dark_theme_style()),
+    'compact': sys.intern(_build_compact_style()),
+}
+
+
+def get_dark_theme_style() -> str:
+    """
+    Get the dark theme stylesheet.
     
-    QLabel {{
-        font-size: 12px;
-    }}
-    """ 
\ No newline at end of file
+    Returns:
+        str: Dark theme CSS stylesheet (interned, safe to compare with ``is``)
+    """
+    return _STYLE_CACHE['dark']
+
+
+def get_compact_style() -> str:
+    """
+    Get a compact stylesheet for smaller screens.
+    
+    Returns:
+        str: Compact CSS stylesheet (interned, safe to compare with ``is``)
+    """
+    return _STYLE_CACHE['compact']
@@ -5,42 +5,190 @@ Contains all custom widgets used throughout the EasyApply application
 including file upload, keyword tables, results display, and infographics.
 """
 
+import os
 import logging
-from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional, Tuple
 from PySide6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QTableWidget,
-    QTableWidgetItem, QHeaderView, QFrame, QScrollArea, QProgressBar,
-    QGroupBox, QTextEdit, QComboBox, QSpinBox, QCheckBox, QSlider,
-    QGridLayout, QSplitter, QTabWidget, QListWidget, QListWidgetItem,
+    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QTableView,
+    QAbstractItemView, QHeaderView, QFrame, QScrollArea, QProgressBar,
+    QGroupBox, QComboBox, QSpinBox, QCheckBox, QSlider,
+    QGridLayout, QSplitter, QTabWidget,
     QGraphicsView, QGraphicsScene, QGraphicsItem, QGraphicsTextItem,
-    QGraphicsEllipseItem, QGraphicsRectItem, QGraphicsLineItem
+    QGraphicsEllipseItem, QGraphicsRectItem, QGraphicsLineItem, QFileDialog
 )
 from PySide6.QtCore import (
     Qt, Signal, QSize, QRect, QPoint, QPropertyAnimation,
-    QEasingCurve, QTimer
+    QEasingCurve, QTimer, QAbstractTableModel, QModelIndex, QObject,
+    QRunnable, QThreadPool
 )
 from PySide6.QtGui import (
-    QFont, QPainter, QColor, QPen, QBrush, QPixmap, QIcon,
+    QFont, QFontMetrics, QPainter, QColor, QPen, QBrush, QPixmap, QIcon,
     QDragEnterEvent, QDropEvent, QPalette
 )
 
+from src.gui.styles import get_font, LABEL_FONT_SIZE
 from src.utils.constants import COLORS, MATCH_COLORS
 from src.utils.logger import get_logger
 
 
+# Parsed colors shared by all table models instead of re-parsing hex per cell
+_MATCH_QCOLORS = {match_type: QColor(color) for match_type, color in MATCH_COLORS.items()}
+_SUCCESS_QCOLOR = QColor(COLORS['success'])
+
+# Shared match breakdown progress bar sheet, one chunk rule per match type
+_PROGRESS_QSS = f"""
+    QProgressBar {{
+        border: 1px solid {COLORS['gray']};
+        border-radius: 3px;
+        text-align: center;
+    }}
+    QProgressBar::chunk {{
+        border-radius: 2px;
+    }}
+""" + "".join(
+    f"""
+    QProgressBar[matchType="{match_type}"]::chunk {{
+        background-color: {MATCH_COLORS[match_type]};
+    }}
+"""
+    for match_type in ('exact', 'fuzzy', 'partial', 'missing')
+)
+
+# Score description and color for each minimum overall score, highest first
+_SCORE_BUCKETS = (
+    (90, "Excellent Match", 'success'),
+    (80, "Very Good Match", 'success'),
+    (70, "Good Match", 'info'),
+    (60, "Fair Match", 'warning'),
+    (50, "Poor Match", 'danger'),
+    (0, "Very Poor Match", 'danger'),
+)
+
+# Score description stylesheets keyed by COLORS entry
+_DESC_QSS_TEMPLATE = """
+    QLabel {{
+        color: {color};
+        padding: 10px;
+    }}
+"""
+_DESC_QSS = {
+    color_key: _DESC_QSS_TEMPLATE.format(color=COLORS[color_key])
+    for color_key in ('success', 'info', 'warning', 'danger', 'gray')
+}
+
+# Status bar stylesheets; indicator sheets are keyed by color value
+_STATUS_INDICATOR_TEMPLATE = """
+    QLabel {{
+        color: {color};
+    }}
+"""
+_STATUS_SHEETS = {
+    color: _STATUS_INDICATOR_TEMPLATE.format(color=color)
+    for color in set(COLORS.values())
+}
+_STATUS_TEXT_QSS = _STATUS_INDICATOR_TEMPLATE.format(color=COLORS['gray'])
+
+
+class LazyWidget(QWidget):
+    """
+    Placeholder that builds its real widget on first use.
+    
+    Results pushed before the widget exists are kept and applied when it
+    is built, so callers can treat it like the wrapped results widget.
+    """
+    
+    def __init__(self, factory: Callable[[], QWidget]):
+        super().__init__()
+        self._factory = factory
+        self._widget = None
+        self._pending_results = None
+        
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+    
+    def is_built(self) -> bool:
+        """Check if the real widget has been created."""
+        return self._widget is not None
+    
+    def ensure_built(self) -> QWidget:
+        """Create the real widget if needed and return it."""
+        if self._widget is None:
+            self._widget = self._factory()
+            self.layout().addWidget(self._widget)
+            
+            if self._pending_results is not None:
+                self._widget.update_results(self._pending_results)
+                self._pending_results = None
+        
+        return self._widget
+    
+    def update_results(self, results: Dict):
+        """Forward results to the real widget, or hold them until it is built."""
+        if self._widget is None:
+            self._pending_results = results
+        else:
+            self._widget.update_results(results)
+    
+    def clear_results(self):
+        """Clear the real widget, or drop any held results."""
+        if self._widget is None:
+            self._pending_results = None
+        else:
+            self._widget.clear_results()
+
+
 class FileUploadWidget(QWidget):
     """Custom file upload widget with drag and drop support."""
     
-    file_selected = Signal(str)
+    files_selected = Signal(list)
     
     def __init__(self):
         super().__init__()
         self.file_path = None
+        self.file_paths = []
         self.logger = get_logger(__name__)
+        self._build_stylesheets()
         self._setup_ui()
         self._setup_drag_drop()
     
+    def _build_stylesheets(self):
+        """Format the stylesheets for each upload state once up front."""
+        self._qss_idle = f"""
+            QFrame {{
+                border: 2px dashed {COLORS['gray']};
+                border-radius: 8px;
+                background-color: {COLORS['light']};
+            }}
+            QFrame:hover {{
+                border-color: {COLORS['primary']};
+                background-color: {COLORS['light_gray']};
+            }}
+        """
+        self._qss_hover = f"""
+            QFrame {{
+                border: 2px dashed {COLORS['primary']};
+                border-radius: 8px;
+                background-color: {COLORS['light_gray']};
+            }}
+        """
+        
+        label_template = """
+            QLabel {{
+                color: {color};
+            }}
+        """
+        self._label_qss_idle = label_template.format(color=COLORS['gray'])
+        self._label_qss_success = label_template.format(color=COLORS['success'])
+        
+        info_template = """
+            QLabel {{
+                color: {color};
+                padding: 5px;
+            }}
+        """
+        self._info_qss_idle = info_template.format(color=COLORS['gray'])
+        self._info_qss_success = info_template.format(color=COLORS['success'])
+    
     def _setup_ui(self):
         """Set up the file upload interface."""
         layout = QVBoxLayout(self)
@@ -51,17 +199,7 @@ class FileUploadWidget(QWidget):
         self.upload_frame = QFrame()
         self.upload_frame.setFrameStyle(QFrame.Box)
         self.upload_frame.setMinimumHeight(120)
-        self.upload_frame.setStyleSheet(f"""
-            QFrame {{
-                border: 2px dashed {COLORS['gray']};
-                border-radius: 8px;
-                background-color: {COLORS['light']};
-            }}
-            QFrame:hover {{
-                border-color: {COLORS['primary']};
-                background-color: {COLORS['light_gray']};
-            }}
-        """)
+        self.upload_frame.setStyleSheet(self._qss_idle)
         
         upload_layout = QVBoxLayout(self.upload_frame)
         upload_layout.setAlignment(Qt.AlignCenter)
@@ -69,13 +207,8 @@ class FileUploadWidget(QWidget):
         # Upload icon/label
         self.upload_label = QLabel("📄 Drop PDF resume here\nor click to browse")
         self.upload_label.setAlignment(Qt.AlignCenter)
-        self.upload_label.setStyleSheet(f"""
-            QLabel {{
-                color: {COLORS['gray']};
-                font-size: 14px;
-                font-weight: bold;
-            }}
-        """)
+        self.upload_label.setFont(get_font(14, bold=True))
+        self.upload_label.setStyleSheet(self._label_qss_idle)
         upload_layout.addWidget(self.upload_label)
         
         # Browse button
@@ -88,13 +221,8 @@ class FileUploadWidget(QWidget):
         
         # File info
         self.file_info_label = QLabel("No file selected")
-        self.file_info_label.setStyleSheet(f"""
-            QLabel {{
-                color: {COLORS['gray']};
-                font-size: 12px;
-                padding: 5px;
-            }}
-        """)
+        self.file_info_label.setFont(get_font(12))
+        self.file_info_label.setStyleSheet(self._info_qss_idle)
         layout.addWidget(self.file_info_label)
         
         # Make upload frame clickable
@@ -106,8 +234,6 @@ class FileUploadWidget(QWidget):
     
     def _browse_files(self):
         """Open file dialog to browse for PDF files."""
-        from PySide6.QtWidgets import QFileDialog
-        
         file_path, _ = QFileDialog.getOpenFileName(
             self,
             "Select Resume PDF",
@@ -124,71 +250,64 @@ class FileUploadWidget(QWidget):
     
     def dragEnterEvent(self, event: QDragEnterEvent):
         """Handle drag enter events."""
-        if event.mimeData().hasUrls():
+        # Only highlight for PDFs so other drags skip the stylesheet repolish
+        # Any PDF in the drag is enough, matching what dropEvent accepts
+        urls = event.mimeData().urls()
+        if any(url.toLocalFile().lower().endswith('.pdf') for url in urls):
             event.acceptProposedAction()
-            self.upload_frame.setStyleSheet(f"""
-                QFrame {{
-                    border: 2px dashed {COLORS['primary']};
-                    border-radius: 8px;
-                    background-color: {COLORS['light_gray']};
-                }}
-            """)
+            self.upload_frame.setStyleSheet(self._qss_hover)
     
     def dragLeaveEvent(self, event):
         """Handle drag leave events."""
-        self.upload_frame.setStyleSheet(f"""
-            QFrame {{
-                border: 2px dashed {COLORS['gray']};
-                border-radius: 8px;
-                background-color: {COLORS['light']};
-            }}
-        """)
+        self.upload_frame.setStyleSheet(self._qss_idle)
     
     def dropEvent(self, event: QDropEvent):
         """Handle drop events."""
-        urls = event.mimeData().urls()
-        if urls:
-            file_path = urls[0].toLocalFile()
-            if file_path.lower().endswith('.pdf'):
-                self.set_file(file_path)
+        pdf_paths = [
+            url.toLocalFile() for url in event.mimeData().urls()
+            if url.toLocalFile().lower().endswith('.pdf')
+        ]
+        if pdf_paths:
+            self.set_files(pdf_paths)
         
-        self.upload_frame.setStyleSheet(f"""
-            QFrame {{
-                border: 2px dashed {COLORS['gray']};
-                border-radius: 8px;
-                background-color: {COLORS['light']};
-            }}
-        """)
+        self.upload_frame.setStyleSheet(self._qss_idle)
     
     def set_file(self, file_path: str):
         """Set the selected file."""
-        self.file_path = file_path
-        file_name = Path(file_path).name
+        self.set_files([file_path])
+    
+    def set_files(self, file_paths: List[str]):
+        """
+        Set the selected files, emitting files_selected once for the batch.
+        
+        The first file is the one used for analysis.
+        """
+        if not file_paths:
+            return
+        
+        self.file_paths = list(file_paths)
+        self.file_path = self.file_paths[0]
+        file_name = os.path.basename(self.file_path)
+        file_count = len(self.file_paths)
+        if file_count > 1:
+            file_name = f"{file_name} ({file_count} files)"
         
         # Update UI
         self.upload_label.setText(f"📄 {file_name}")
-        self.upload_label.setStyleSheet(f"""
-            QLabel {{
-                color: {COLORS['success']};
-                font-size: 14px;
-                font-weight: bold;
-            }}
-        """)
+        self.upload_label.setStyleSheet(self._label_qss_success)
         
         # Update file info
-        file_size = Path(file_path).stat().st_size / 1024  # KB
-        self.file_info_label.setText(f"File: {file_name} ({file_size:.1f} KB)")
-        self.file_info_label.setStyleSheet(f"""
-            QLabel {{
-                color: {COLORS['success']};
-                font-size: 12px;
-                padding: 5px;
-            }}
-        """)
+        try:
+            file_size = os.path.getsize(self.file_path) / 1024  # KB
+            self.file_info_label.setText(f"File: {file_name} ({file_size:.1f} KB)")
+        except OSError as e:
+            self.logger.warning(f"Could not read size of {self.file_path}: {e}")
+            self.file_info_label.setText(f"File: {file_name}")
+        self.file_info_label.setStyleSheet(self._info_qss_success)
         
         # Emit signal
-        self.file_selected.emit(file_path)
-        self.logger.info(f"File selected: {file_path}")
+        self.files_selected.emit(self.file_paths)
+        self.logger.info(f"Files selected: {self.file_paths}")
     
     def has_file(self) -> bool:
         """Check if a file is selected."""
@@ -197,6 +316,167 @@ class FileUploadWidget(QWidget):
     def get_file_path(self) -> Optional[str]:
         """Get the selected file path."""
         return self.file_path
+    
+    def get_file_paths(self) -> List[str]:
+        """Get all selected file paths."""
+        return self.file_paths
+
+
+class KeywordMatchModel(QAbstractTableModel):
+    """
+    Table model exposing keyword match results to a QTableView.
+    
+    Rows are display-ready tuples built by prepare_rows(), which is pure
+    Python and can run off the GUI thread; data() only indexes into them.
+    """
+    
+    HEADERS = ["Resume Keyword", "Job Keyword", "Match Type", "Confidence", "Importance", "Status"]
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows: List[Tuple] = []
+    
+    @staticmethod
+    def prepare_rows(matches: List[Dict]) -> List[Tuple]:
+        """Format match dictionaries into row tuples (display columns + match type)."""
+        rows = []
+        for match in matches:
+            importance = max(match.get('resume_importance', 0), match.get('job_importance', 0))
+            rows.append((
+                match['resume_keyword'],
+                match['job_keyword'],
+                match['match_type'].title(),
+                f"{match.get('confidence', 0):.2f}",
+                f"{importance:.2f}",
+                "✓ Matched",
+                match['match_type']
+            ))
+        return rows
+    
+    def set_rows(self, rows: List[Tuple]):
+        """Replace the model contents with rows from prepare_rows()."""
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+    
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+    
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.HEADERS[section]
+        return None
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        
+        row = self._rows[index.row()]
+        column = index.column()
+        
+        if role == Qt.DisplayRole:
+            return row[column]
+        
+        if role == Qt.BackgroundRole and column in (0, 1):
+            return _MATCH_QCOLORS[row[6]]
+        
+        if role == Qt.ForegroundRole and column == 5:
+            return _SUCCESS_QCOLOR
+        
+        return None
+
+
+class MissingKeywordModel(QAbstractTableModel):
+    """Table model exposing missing job keywords to a QTableView."""
+    
+    HEADERS = ["Missing Keyword", "Importance", "Type", "Recommendation"]
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows: List[Tuple] = []
+    
+    @staticmethod
+    def prepare_rows(missing_keywords: List[Dict]) -> List[Tuple]:
+        """Format missing keyword dictionaries into display-ready row tuples."""
+        rows = []
+        for keyword in missing_keywords:
+            if keyword['importance'] >= 0.8:
+                recommendation = "High Priority - Add to resume"
+            elif keyword['importance'] >= 0.5:
+                recommendation = "Medium Priority - Consider adding"
+            else:
+                recommendation = "Low Priority - Optional"
+            
+            rows.append((
+                keyword['keyword'],
+                f"{keyword['importance']:.2f}",
+                keyword.get('type', 'Unknown'),
+                recommendation
+            ))
+        return rows
+    
+    def set_rows(self, rows: List[Tuple]):
+        """Replace the model contents with rows from prepare_rows()."""
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+    
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+    
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.HEADERS[section]
+        return None
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        
+        if role == Qt.DisplayRole:
+            return self._rows[index.row()][index.column()]
+        
+        if role == Qt.BackgroundRole and index.column() == 0:
+            return _MATCH_QCOLORS['missing']
+        
+        return None
+
+
+class _ResultsPrepEmitter(QObject):
+    """Carries prepared table rows from the thread pool back to the GUI thread."""
+    
+    prepared = Signal(int, list, list, list, list)
+
+
+class _ResultsPrepTask(QRunnable):
+    """Thread pool task that formats match results into table rows."""
+    
+    def __init__(self, generation: int, match_results: Dict, emitter: _ResultsPrepEmitter):
+        super().__init__()
+        self.generation = generation
+        self.match_results = match_results
+        self.emitter = emitter
+    
+    def run(self):
+        """Build the rows for all four tables and hand them to the GUI thread."""
+        exact_rows = KeywordMatchModel.prepare_rows(self.match_results['exact_matches'])
+        fuzzy_rows = KeywordMatchModel.prepare_rows(self.match_results['fuzzy_matches'])
+        partial_rows = KeywordMatchModel.prepare_rows(self.match_results['partial_matches'])
+        missing_rows = MissingKeywordModel.prepare_rows(self.match_results['missing_keywords'])
+        
+        try:
+            self.emitter.prepared.emit(
+                self.generation, exact_rows, fuzzy_rows, partial_rows, missing_rows
+            )
+        except RuntimeError:
+            # The owning widget was destroyed before the rows were ready
+            pass
 
 
 class KeywordTableWidget(QWidget):
@@ -205,6 +485,9 @@ class KeywordTableWidget(QWidget):
     def __init__(self):
         super().__init__()
         self.logger = get_logger(__name__)
+        self._generation = 0
+        self._prep_emitter = _ResultsPrepEmitter(self)
+        self._prep_emitter.prepared.connect(self._apply_prepared_rows, Qt.QueuedConnection)
         self._setup_ui()
     
     def _setup_ui(self):
@@ -234,139 +517,104 @@ class KeywordTableWidget(QWidget):
         
         layout.addWidget(self.tab_widget)
     
-    def _create_keyword_table(self, title: str) -> QTableWidget:
+    def _create_keyword_table(self, title: str) -> QTableView:
         """Create a keyword table with standard columns."""
-        table = QTableWidget()
-        table.setColumnCount(6)
-        table.setHorizontalHeaderLabels([
-            "Resume Keyword", "Job Keyword", "Match Type", "Confidence", "Importance", "Status"
-        ])
+        table = QTableView()
+        table.setModel(KeywordMatchModel(table))
         
         # Set table properties
         table.setAlternatingRowColors(True)
-        table.setSelectionBehavior(QTableWidget.SelectRows)
-        table.setEditTriggers(QTableWidget.NoEditTriggers)
+        table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
         
         # Set column widths
         header = table.horizontalHeader()
         header.setSectionResizeMode(0, QHeaderView.Stretch)
         header.setSectionResizeMode(1, QHeaderView.Stretch)
-        header.setSectionResizeMode(2, QHeaderView.ResizeToContents)
-        header.setSectionResizeMode(3, QHeaderView.ResizeToContents)
-        header.setSectionResizeMode(4, QHeaderView.ResizeToContents)
-        header.setSectionResizeMode(5, QHeaderView.ResizeToContents)
+        self._set_fixed_column_width(table, 2, "Partial")
+        self._set_fixed_column_width(table, 3, "0.00")
+        self._set_fixed_column_width(table, 4, "0.00")
+        self._set_fixed_column_width(table, 5, "✓ Matched")
         
         return table
     
-    def _create_missing_table(self) -> QTableWidget:
+    def _create_missing_table(self) -> QTableView:
         """Create a table for missing keywords."""
-        table = QTableWidget()
-        table.setColumnCount(4)
-        table.setHorizontalHeaderLabels([
-            "Missing Keyword", "Importance", "Type", "Recommendation"
-        ])
+        table = QTableView()
+        table.setModel(MissingKeywordModel(table))
         
         # Set table properties
         table.setAlternatingRowColors(True)
-        table.setSelectionBehavior(QTableWidget.SelectRows)
-        table.setEditTriggers(QTableWidget.NoEditTriggers)
+        table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
         
         # Set column widths
         header = table.horizontalHeader()
         header.setSectionResizeMode(0, QHeaderView.Stretch)
-        header.setSectionResizeMode(1, QHeaderView.ResizeToContents)
-        header.setSectionResizeMode(2, QHeaderView.ResizeToContents)
+        self._set_fixed_column_width(table, 1, "0.00")
+        self._set_fixed_column_width(table, 2, "noun_phrase")
         header.setSectionResizeMode(3, QHeaderView.Stretch)
         
         return table
     
-    def update_results(self, results: Dict):
-        """Update the tables with analysis results."""
-        match_results = results['match_results']
-        
-        # Update exact matches
-        self._populate_table(self.exact_table, match_results['exact_matches'])
-        
-        # Update fuzzy matches
-        self._populate_table(self.fuzzy_table, match_results['fuzzy_matches'])
-        
-        # Update partial matches
-        self._populate_table(self.partial_table, match_results['partial_matches'])
+    @staticmethod
+    def _set_fixed_column_width(table: QTableView, column: int, sample: str, padding: int = 24):
+        """
+        Give a column a fixed width measured once from its header and a sample value.
         
-        # Update missing keywords
-        self._populate_missing_table(self.missing_table, match_results['missing_keywords'])
+        ResizeToContents would re-measure every row on each model reset.
+        """
+        header = table.horizontalHeader()
+        metrics = QFontMetrics(header.font())
+        title = table.model().headerData(column, Qt.Horizontal)
+        width = max(metrics.horizontalAdvance(title), metrics.horizontalAdvance(sample))
         
-        self.logger.info("Keyword tables updated with results")
+        header.setSectionResizeMode(column, QHeaderView.Fixed)
+        table.setColumnWidth(column, width + padding)
     
-    def _populate_table(self, table: QTableWidget, matches: List[Dict]):
-        """Populate a keyword table with match data."""
-        table.setRowCount(len(matches))
-        
-        for row, match in enumerate(matches):
-            # Resume keyword
-            resume_item = QTableWidgetItem(match['resume_keyword'])
-            resume_item.setBackground(QColor(MATCH_COLORS[match['match_type']]))
-            table.setItem(row, 0, resume_item)
-            
-            # Job keyword
-            job_item = QTableWidgetItem(match['job_keyword'])
-            job_item.setBackground(QColor(MATCH_COLORS[match['match_type']]))
-            table.setItem(row, 1, job_item)
-            
-            # Match type
-            type_item = QTableWidgetItem(match['match_type'].title())
-            table.setItem(row, 2, type_item)
-            
-            # Confidence
-            confidence = match.get('confidence', 0)
-            confidence_item = QTableWidgetItem(f"{confidence:.2f}")
-            table.setItem(row, 3, confidence_item)
-            
-            # Importance
-            importance = max(match.get('resume_importance', 0), match.get('job_importance', 0))
-            importance_item = QTableWidgetItem(f"{importance:.2f}")
-            table.setItem(row, 4, importance_item)
-            
-            # Status
-            status_item = QTableWidgetItem("✓ Matched")
-            status_item.setForeground(QColor(COLORS['success']))
-            table.setItem(row, 5, status_item)
-    
-    def _populate_missing_table(self, table: QTableWidget, missing_keywords: List[Dict]):
-        """Populate the missing keywords table."""
-        table.setRowCount(len(missing_keywords))
-        
-        for row, keyword in enumerate(missing_keywords):
-            # Missing keyword
-            keyword_item = QTableWidgetItem(keyword['keyword'])
-            keyword_item.setBackground(QColor(MATCH_COLORS['missing']))
-            table.setItem(row, 0, keyword_item)
-            
-            # Importance
-            importance_item = QTableWidgetItem(f"{keyword['importance']:.2f}")
-            table.setItem(row, 1, importance_item)
+    def update_results(self, results: Dict):
+        """Update the tables with analysis results."""
+        # Rows are formatted on the thread pool; only the model reset runs here
+        self._generation += 1
+        QThreadPool.globalInstance().start(
+            _ResultsPrepTask(self._generation, results['match_results'], self._prep_emitter)
+        )
+    
+    def _apply_prepared_rows(self, generation: int, exact_rows: List, fuzzy_rows: List,
+                             partial_rows: List, missing_rows: List):
+        """Load rows prepared by _ResultsPrepTask into the table models."""
+        if generation != self._generation:
+            # Superseded by a newer update or a clear
+            return
+        
+        # Repaint once after all four models are reset instead of per table
+        self.tab_widget.setUpdatesEnabled(False)
+        try:
+            # Update exact matches
+            self.exact_table.model().set_rows(exact_rows)
             
-            # Type
-            type_item = QTableWidgetItem(keyword.get('type', 'Unknown'))
-            table.setItem(row, 2, type_item)
+            # Update fuzzy matches
+            self.fuzzy_table.model().set_rows(fuzzy_rows)
             
-            # Recommendation
-            if keyword['importance'] >= 0.8:
-                recommendation = "High Priority - Add to resume"
-            elif keyword['importance'] >= 0.5:
-                recommendation = "Medium Priority - Consider adding"
-            else:
-                recommendation = "Low Priority - Optional"
+            # Update partial matches
+            self.partial_table.model().set_rows(partial_rows)
             
-            rec_item = QTableWidgetItem(recommendation)
-            table.setItem(row, 3, rec_item)
+            # Update missing keywords
+            self.missing_table.model().set_rows(missing_rows)
+        finally:
+            self.tab_widget.setUpdatesEnabled(True)
+        
+        self.logger.info("Keyword tables updated with results")
     
     def clear_results(self):
         """Clear all tables."""
-        self.exact_table.setRowCount(0)
-        self.fuzzy_table.setRowCount(0)
-        self.partial_table.setRowCount(0)
-        self.missing_table.setRowCount(0)
+        self._generation += 1
+        self.exact_table.model().set_rows([])
+        self.fuzzy_table.model().set_rows([])
+        self.partial_table.model().set_rows([])
+        self.missing_table.model().set_rows([])
 
 
 class ResultsWidget(QWidget):
@@ -408,7 +656,8 @@ class ResultsWidget(QWidget):
         for i, field in enumerate(score_fields):
             label = QLabel(field.replace('_', ' ').title() + ":")
             value = QLabel("0")
-            value.setStyleSheet(f"font-weight: bold; color: {COLORS['primary']};")
+            value.setFont(get_font(LABEL_FONT_SIZE, bold=True))
+            value.setStyleSheet(f"color: {COLORS['primary']};")
             
             scores_layout.addWidget(label, i // 2, (i % 2) * 2)
             scores_layout.addWidget(value, i // 2, (i % 2) * 2 + 1)
@@ -421,9 +670,11 @@ class ResultsWidget(QWidget):
         self.summary_group = QGroupBox("Analysis Summary")
         summary_layout = QVBoxLayout(self.summary_group)
         
-        self.summary_text = QTextEdit()
-        self.summary_text.setReadOnly(True)
-        self.summary_text.setMaximumHeight(150)
+        self.summary_text = QLabel()
+        self.summary_text.setTextFormat(Qt.PlainText)
+        self.summary_text.setWordWrap(True)
+        self.summary_text.setTextInteractionFlags(Qt.TextSelectableByMouse)
+        self.summary_text.setAlignment(Qt.AlignTop)
         summary_layout.addWidget(self.summary_text)
         
         content_layout.addWidget(self.summary_group)
@@ -432,8 +683,10 @@ class ResultsWidget(QWidget):
         self.recommendations_group = QGroupBox("Recommendations")
         recommendations_layout = QVBoxLayout(self.recommendations_group)
         
-        self.recommendations_list = QListWidget()
-        recommendations_layout.addWidget(self.recommendations_list)
+        self.recommendations_label = QLabel()
+        self.recommendations_label.setWordWrap(True)
+        self.recommendations_label.setTextInteractionFlags(Qt.TextSelectableByMouse)
+        recommendations_layout.addWidget(self.recommendations_label)
         
         content_layout.addWidget(self.recommendations_group)
         
@@ -459,24 +712,23 @@ class ResultsWidget(QWidget):
                     label.setText(str(value))
         
         # Update summary
-        summary_text = f"""
-Overall Assessment: {summary['overall_assessment']}
-
-High Importance Matches: {summary['high_importance_matches']}
-Medium Importance Matches: {summary['medium_importance_matches']}
-Low Importance Matches: {summary['low_importance_matches']}
-Missing Keywords: {summary['missing_keywords_count']}
-
-Total Resume Keywords: {results['total_resume_keywords']}
-Total Job Keywords: {results['total_job_keywords']}
-        """
-        self.summary_text.setPlainText(summary_text.strip())
+        summary_text = "\n".join((
+            f"Overall Assessment: {summary['overall_assessment']}",
+            "",
+            f"High Importance Matches: {summary['high_importance_matches']}",
+            f"Medium Importance Matches: {summary['medium_importance_matches']}",
+            f"Low Importance Matches: {summary['low_importance_matches']}",
+            f"Missing Keywords: {summary['missing_keywords_count']}",
+            "",
+            f"Total Resume Keywords: {results['total_resume_keywords']}",
+            f"Total Job Keywords: {results['total_job_keywords']}",
+        ))
+        self.summary_text.setText(summary_text)
         
         # Update recommendations
-        self.recommendations_list.clear()
-        for recommendation in summary['recommendations']:
-            item = QListWidgetItem(f"• {recommendation}")
-            self.recommendations_list.addItem(item)
+        self.recommendations_label.setText(
+            "\n".join(f"• {recommendation}" for recommendation in summary['recommendations'])
+        )
         
         self.logger.info("Detailed results updated")
     
@@ -486,7 +738,7 @@ Total Job Keywords: {results['total_job_keywords']}
             label.setText("0")
         
         self.summary_text.clear()
-        self.recommendations_list.clear()
+        self.recommendations_label.clear()
 
 
 class InfographicWidget(QWidget):
@@ -495,6 +747,9 @@ class InfographicWidget(QWidget):
     def __init__(self):
         super().__init__()
         self.logger = get_logger(__name__)
+        # Last values pushed to each label/bar, used to skip no-op relayouts
+        self._last_stats = {}
+        self._last_progress = {}
         self._setup_ui()
     
     def _setup_ui(self):
@@ -509,10 +764,9 @@ class InfographicWidget(QWidget):
         
         self.score_label = QLabel("0%")
         self.score_label.setAlignment(Qt.AlignCenter)
+        self.score_label.setFont(get_font(48, bold=True))
         self.score_label.setStyleSheet(f"""
             QLabel {{
-                font-size: 48px;
-                font-weight: bold;
                 color: {COLORS['primary']};
                 padding: 20px;
             }}
@@ -521,13 +775,8 @@ class InfographicWidget(QWidget):
         
         self.score_description = QLabel("No analysis performed")
         self.score_description.setAlignment(Qt.AlignCenter)
-        self.score_description.setStyleSheet(f"""
-            QLabel {{
-                font-size: 16px;
-                color: {COLORS['gray']};
-                padding: 10px;
-            }}
-        """)
+        self.score_description.setFont(get_font(16))
+        self.score_description.setStyleSheet(_DESC_QSS['gray'])
         score_layout.addWidget(self.score_description)
         
         layout.addWidget(self.score_group)
@@ -549,7 +798,8 @@ class InfographicWidget(QWidget):
         for i, (field, title) in enumerate(stat_fields):
             label = QLabel(title + ":")
             value = QLabel("0")
-            value.setStyleSheet(f"font-weight: bold; color: {COLORS['primary']};")
+            value.setFont(get_font(LABEL_FONT_SIZE, bold=True))
+            value.setStyleSheet(f"color: {COLORS['primary']};")
             
             stats_layout.addWidget(label, i // 2, (i % 2) * 2)
             stats_layout.addWidget(value, i // 2, (i % 2) * 2 + 1)
@@ -562,15 +812,18 @@ class InfographicWidget(QWidget):
         self.progress_group = QGroupBox("Match Breakdown")
         progress_layout = QVBoxLayout(self.progress_group)
         
+        # One sheet for all bars; each bar picks its chunk color via matchType
+        self.progress_group.setStyleSheet(_PROGRESS_QSS)
+        
         self.progress_bars = {}
         progress_fields = [
-            ("exact", "Exact Matches", MATCH_COLORS['exact']),
-            ("fuzzy", "Fuzzy Matches", MATCH_COLORS['fuzzy']),
-            ("partial", "Partial Matches", MATCH_COLORS['partial']),
-            ("missing", "Missing", MATCH_COLORS['missing'])
+            ("exact", "Exact Matches"),
+            ("fuzzy", "Fuzzy Matches"),
+            ("partial", "Partial Matches"),
+            ("missing", "Missing")
         ]
         
-        for field, title, color in progress_fields:
+        for field, title in progress_fields:
             container = QWidget()
             container_layout = QHBoxLayout(container)
             container_layout.setContentsMargins(0, 5, 0, 5)
@@ -580,17 +833,7 @@ class InfographicWidget(QWidget):
             
             progress_bar = QProgressBar()
             progress_bar.setMaximum(100)
-            progress_bar.setStyleSheet(f"""
-                QProgressBar {{
-                    border: 1px solid {COLORS['gray']};
-                    border-radius: 3px;
-                    text-align: center;
-                }}
-                QProgressBar::chunk {{
-                    background-color: {color};
-                    border-radius: 2px;
-                }}
-            """)
+            progress_bar.setProperty("matchType", field)
             
             percentage_label = QLabel("0%")
             percentage_label.setMinimumWidth(50)
@@ -613,93 +856,80 @@ class InfographicWidget(QWidget):
         match_results = results['match_results']
         scores = match_results['scores']
         
+        # Snapshot the counts once so every widget below sees the same values
+        total_resume = len(results['resume_keywords'])
+        total_job = len(results['job_keywords'])
+        missing_count = len(match_results['missing_keywords'])
+        exact_count = scores['exact_matches_count']
+        fuzzy_count = scores['fuzzy_matches_count']
+        partial_count = scores['partial_matches_count']
+        
         # Update main score
         overall_score = scores['overall_score']
         self.score_label.setText(f"{overall_score:.1f}%")
         
         # Update score description
-        if overall_score >= 90:
-            description = "Excellent Match"
-            color = COLORS['success']
-        elif overall_score >= 80:
-            description = "Very Good Match"
-            color = COLORS['success']
-        elif overall_score >= 70:
-            description = "Good Match"
-            color = COLORS['info']
-        elif overall_score >= 60:
-            description = "Fair Match"
-            color = COLORS['warning']
-        elif overall_score >= 50:
-            description = "Poor Match"
-            color = COLORS['danger']
-        else:
-            description = "Very Poor Match"
-            color = COLORS['danger']
+        description, color_key = next(
+            ((desc, color) for threshold, desc, color in _SCORE_BUCKETS if overall_score >= threshold),
+            _SCORE_BUCKETS[-1][1:]
+        )
         
         self.score_description.setText(description)
-        self.score_description.setStyleSheet(f"""
-            QLabel {{
-                font-size: 16px;
-                color: {color};
-                padding: 10px;
-            }}
-        """)
+        self.score_description.setStyleSheet(_DESC_QSS[color_key])
         
         # Update statistics
         stats_data = {
-            'resume_keywords': len(results['resume_keywords']),
-            'job_keywords': len(results['job_keywords']),
-            'exact_matches': scores['exact_matches_count'],
-            'fuzzy_matches': scores['fuzzy_matches_count'],
-            'partial_matches': scores['partial_matches_count'],
-            'missing_keywords': len(match_results['missing_keywords'])
+            'resume_keywords': total_resume,
+            'job_keywords': total_job,
+            'exact_matches': exact_count,
+            'fuzzy_matches': fuzzy_count,
+            'partial_matches': partial_count,
+            'missing_keywords': missing_count
         }
         
         for field, value in stats_data.items():
             if field in self.stats_labels:
-                self.stats_labels[field].setText(str(value))
+                self._set_stat(field, value)
         
         # Update progress bars
-        total_job_keywords = len(results['job_keywords'])
-        if total_job_keywords > 0:
-            exact_pct = (scores['exact_matches_count'] / total_job_keywords) * 100
-            fuzzy_pct = (scores['fuzzy_matches_count'] / total_job_keywords) * 100
-            partial_pct = (scores['partial_matches_count'] / total_job_keywords) * 100
-            missing_pct = (len(match_results['missing_keywords']) / total_job_keywords) * 100
-            
-            self.progress_bars['exact'][0].setValue(int(exact_pct))
-            self.progress_bars['exact'][1].setText(f"{exact_pct:.1f}%")
+        if total_job > 0:
+            exact_pct = (exact_count / total_job) * 100
+            fuzzy_pct = (fuzzy_count / total_job) * 100
+            partial_pct = (partial_count / total_job) * 100
+            missing_pct = (missing_count / total_job) * 100
             
-            self.progress_bars['fuzzy'][0].setValue(int(fuzzy_pct))
-            self.progress_bars['fuzzy'][1].setText(f"{fuzzy_pct:.1f}%")
-            
-            self.progress_bars['partial'][0].setValue(int(partial_pct))
-            self.progress_bars['partial'][1].setText(f"{partial_pct:.1f}%")
-            
-            self.progress_bars['missing'][0].setValue(int(missing_pct))
-            self.progress_bars['missing'][1].setText(f"{missing_pct:.1f}%")
+            self._set_progress('exact', int(exact_pct), f"{exact_pct:.1f}%")
+            self._set_progress('fuzzy', int(fuzzy_pct), f"{fuzzy_pct:.1f}%")
+            self._set_progress('partial', int(partial_pct), f"{partial_pct:.1f}%")
+            self._set_progress('missing', int(missing_pct), f"{missing_pct:.1f}%")
         
         self.logger.info("Infographic updated with results")
     
+    def _set_stat(self, field: str, value: int):
+        """Update a statistic label, skipping the relayout if the value is unchanged."""
+        if self._last_stats.get(field) != value:
+            self.stats_labels[field].setText(str(value))
+            self._last_stats[field] = value
+    
+    def _set_progress(self, field: str, value: int, text: str):
+        """Update a progress bar and its label, skipping unchanged values."""
+        if self._last_progress.get(field) != (value, text):
+            progress_bar, percentage_label = self.progress_bars[field]
+            progress_bar.setValue(value)
+            percentage_label.setText(text)
+            self._last_progress[field] = (value, text)
+    
     def clear_results(self):
         """Clear all infographic data."""
         self.score_label.setText("0%")
         self.score_description.setText("No analysis performed")
-        self.score_description.setStyleSheet(f"""
-            QLabel {{
-                font-size: 16px;
-                color: {COLORS['gray']};
-                padding: 10px;
-            }}
-        """)
+        self.score_description.setStyleSheet(_DESC_QSS['gray'])
         
-        for label in self.stats_labels.values():
-            label.setText("0")
+        for field in self.stats_labels:
+            self._set_stat(field, 0)
         
-        for progress_bar, percentage_label in self.progress_bars.values():
-            progress_bar.setValue(0)
-            percentage_label.setText("0%")
+        for field in self.progress_bars:
+            self._set_progress(field, 0, "0%")
 
 
 class SettingsWidget(QWidget):
@@ -738,7 +968,9 @@ class SettingsWidget(QWidget):
         self.fuzzy_threshold_slider.setTickInterval(10)
         analysis_layout.addWidget(self.fuzzy_threshold_slider, 0, 1)
         
-        self.fuzzy_threshold_label = QLabel("70%")
+        # Seeded from the slider so the skip check and label track its default
+        self._last_fuzzy = self.fuzzy_threshold_slider.value()
+        self.fuzzy_threshold_label = QLabel(f"{self._last_fuzzy}%")
         analysis_layout.addWidget(self.fuzzy_threshold_label, 0, 2)
         
         # Max keywords
@@ -784,7 +1016,10 @@ class SettingsWidget(QWidget):
     
     def _on_fuzzy_threshold_changed(self, value: int):
         """Handle fuzzy threshold slider changes."""
-        self.fuzzy_threshold_label.setText(f"{value}%")
+        if value == self._last_fuzzy:
+            return
+        self._last_fuzzy = value
+        self.fuzzy_threshold_label.setText(str(value) + "%")
     
     def get_settings(self) -> Dict:
         """Get current settings."""
@@ -821,7 +1056,6 @@ class StatusWidget(QWidget):
     
     def __init__(self):
         super().__init__()
-        self.logger = get_logger(__name__)
         self._setup_ui()
     
     def _setup_ui(self):
@@ -832,33 +1066,21 @@ class StatusWidget(QWidget):
         
         # Status indicator
         self.status_indicator = QLabel("●")
-        self.status_indicator.setStyleSheet(f"""
-            QLabel {{
-                color: {COLORS['success']};
-                font-size: 12px;
-                font-weight: bold;
-            }}
-        """)
+        self.status_indicator.setFont(get_font(12, bold=True))
+        self.status_indicator.setStyleSheet(_STATUS_SHEETS[COLORS['success']])
+        self._last_color = COLORS['success']
         layout.addWidget(self.status_indicator)
         
         # Status text
         self.status_text = QLabel("Ready")
-        self.status_text.setStyleSheet(f"""
-            QLabel {{
-                color: {COLORS['gray']};
-                font-size: 11px;
-            }}
-        """)
+        self.status_text.setFont(get_font(11))
+        self.status_text.setStyleSheet(_STATUS_TEXT_QSS)
         layout.addWidget(self.status_text)
         
         # Memory usage
         self.memory_label = QLabel("Memory: 0 MB")
-        self.memory_label.setStyleSheet(f"""
-            QLabel {{
-                color: {COLORS['gray']};
-                font-size: 11px;
-            }}
-        """)
+        self.memory_label.setFont(get_font(11))
+        self.memory_label.setStyleSheet(_STATUS_TEXT_QSS)
         layout.addWidget(self.memory_label)
         
         # Add stretch to push everything to the right
@@ -867,13 +1089,13 @@ class StatusWidget(QWidget):
     def set_status(self, status: str, color: str = COLORS['success']):
         """Set the status text and color."""
         self.status_text.setText(status)
-        self.status_indicator.setStyleSheet(f"""
-            QLabel {{
-                color: {color};
-                font-size: 12px;
-                font-weight: bold;
-            }}
-        """)
+        
+        # Restyling re-polishes the label, so skip it when the color is unchanged
+        if color == self._last_color:
+            return
+        self._last_color = color
+        sheet = _STATUS_SHEETS.get(color) or _STATUS_INDICATOR_TEMPLATE.format(color=color)
+        self.status_indicator.setStyleSheet(sheet)
     
     def set_memory_usage(self, memory_mb: float):
         """Set the memory usage display."""
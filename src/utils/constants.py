@@ -5,7 +5,15 @@ Contains all application-wide constants, configuration values, and settings.
 """
 
 import os
+import sys
 from pathlib import Path
+from types import MappingProxyType
+
+
+def _frozen_strings(mapping):
+    """Wrap a str-to-str mapping read-only, interning its keys and values."""
+    return MappingProxyType({sys.intern(k): sys.intern(v) for k, v in mapping.items()})
+
 
 # Application Information
 APP_NAME = "EasyApply"
@@ -22,9 +30,13 @@ DATA_DIR = BASE_DIR / "data"
 TEMP_DIR = BASE_DIR / "temp"
 
 # Supported File Formats
-SUPPORTED_RESUME_FORMATS = [".pdf", ".docx", ".txt"]
+SUPPORTED_RESUME_FORMATS = frozenset({".pdf", ".docx", ".txt"})
 SUPPORTED_EXPORT_FORMATS = [".pdf", ".xlsx", ".json", ".csv"]
 
+# Filename characters replaced with underscores, as a str.translate table
+INVALID_FILENAME_CHARS = '<>:"/\\|?*'
+FILENAME_SANITIZE_TABLE = MappingProxyType(str.maketrans(dict.fromkeys(INVALID_FILENAME_CHARS, '_')))
+
 # PDF Processing Settings
 PDF_MAX_SIZE_MB = 50
 PDF_PASSWORD_TIMEOUT = 30  # seconds
@@ -63,7 +75,7 @@ EXPORT_TEMPLATE_DIR = RESOURCES_DIR / "templates"
 DEFAULT_REPORT_TEMPLATE = "default_report.html"
 
 # Error Messages
-ERROR_MESSAGES = {
+ERROR_MESSAGES = _frozen_strings({
     "file_not_found": "File not found: {}",
     "invalid_file_format": "Invalid file format. Supported formats: {}",
     "file_too_large": "File is too large. Maximum size: {} MB",
@@ -74,18 +86,18 @@ ERROR_MESSAGES = {
     "invalid_job_description": "Please enter a valid job description",
     "database_error": "Database error: {}",
     "plugin_error": "Plugin error: {}",
-}
+})
 
 # Success Messages
-SUCCESS_MESSAGES = {
+SUCCESS_MESSAGES = _frozen_strings({
     "file_uploaded": "File uploaded successfully",
     "analysis_complete": "Analysis completed successfully",
     "export_complete": "Export completed successfully",
     "settings_saved": "Settings saved successfully",
-}
+})
 
 # Color Schemes
-COLORS = {
+COLORS = _frozen_strings({
     "primary": "#2E86AB",
     "secondary": "#A23B72",
     "success": "#28A745",
@@ -98,44 +110,44 @@ COLORS = {
     "black": "#000000",
     "gray": "#6C757D",
     "light_gray": "#E9ECEF",
-}
+})
 
 # Match Status Colors
-MATCH_COLORS = {
+MATCH_COLORS = _frozen_strings({
     "exact": "#28A745",    # Green
     "fuzzy": "#FFC107",    # Yellow
     "partial": "#FD7E14",  # Orange
     "missing": "#DC3545",  # Red
     "neutral": "#6C757D",  # Gray
-}
+})
 
 # Default Keywords by Industry
-DEFAULT_KEYWORDS = {
-    "software_development": [
+DEFAULT_KEYWORDS = MappingProxyType({
+    "software_development": tuple(map(sys.intern, (
         "Python", "Java", "JavaScript", "React", "Angular", "Vue.js",
         "Node.js", "Django", "Flask", "Spring", "Docker", "Kubernetes",
         "AWS", "Azure", "GCP", "Git", "GitHub", "CI/CD", "Agile",
         "Scrum", "REST API", "GraphQL", "SQL", "NoSQL", "MongoDB",
         "PostgreSQL", "MySQL", "Redis", "Microservices", "DevOps"
-    ],
-    "data_science": [
+    ))),
+    "data_science": tuple(map(sys.intern, (
         "Python", "R", "SQL", "Pandas", "NumPy", "Matplotlib",
         "Seaborn", "Scikit-learn", "TensorFlow", "PyTorch", "Keras",
         "Jupyter", "Tableau", "Power BI", "Apache Spark", "Hadoop",
         "Machine Learning", "Deep Learning", "Neural Networks",
         "Statistical Analysis", "Data Visualization", "ETL", "Big Data"
-    ],
-    "marketing": [
+    ))),
+    "marketing": tuple(map(sys.intern, (
         "Digital Marketing", "SEO", "SEM", "Google Ads", "Facebook Ads",
         "Social Media Marketing", "Content Marketing", "Email Marketing",
         "Marketing Automation", "Analytics", "Google Analytics",
         "Conversion Optimization", "Brand Management", "Market Research",
         "Customer Acquisition", "Lead Generation", "CRM", "Salesforce"
-    ]
-}
+    )))
+})
 
 # Configuration Keys
-CONFIG_KEYS = {
+CONFIG_KEYS = _frozen_strings({
     "theme": "app_theme",
     "language": "app_language",
     "auto_save": "auto_save_enabled",
@@ -144,16 +156,16 @@ CONFIG_KEYS = {
     "default_export_format": "default_export_format",
     "fuzzy_match_threshold": "fuzzy_match_threshold",
     "max_recent_files": "max_recent_files",
-}
+})
 
 # Default Configuration Values
-DEFAULT_CONFIG = {
+DEFAULT_CONFIG = MappingProxyType({
     "app_theme": "light",
     "app_language": "en",
     "auto_save_enabled": True,
     "auto_save_interval": 300,  # 5 minutes
-    "recent_files": [],
+    "recent_files": (),
     "default_export_format": "pdf",
     "fuzzy_match_threshold": 70,
     "max_recent_files": 10,
-} 
\ No newline at end of file
+}) 
\ No newline at end of file
@@ -9,14 +9,77 @@ import os
 import re
 import json
 import hashlib
+import marshal
+import math
+import mmap
+import shutil
+import sys
+from collections import defaultdict
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Union, Tuple
 from datetime import datetime, timedelta
 import logging
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+from src.utils.constants import FILENAME_SANITIZE_TABLE
 from src.utils.logger import get_logger
 
 
+# Precompiled patterns for the text helpers below
+_WS_RE = re.compile(r'\s+')
+_SPECIAL_RE = re.compile(r'[^\w\s\-\.\,\;\:\!\?\(\)\[\]\{\}]')
+_NL_RE = re.compile(r'\n+')
+_NORM_SPECIAL_RE = re.compile(r'[^\w\s\-\.]')
+_WORD_RE = re.compile(r'\b\w+\b')
+_SENT_RE = re.compile(r'[.!?]+')
+
+# Units for format_file_size, in steps of 1024
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
+
+# Read size for hashing files without hashlib.file_digest
+_HASH_CHUNK_SIZE = 1 << 20
+
+# Files larger than this are memory-mapped for hashing
+_MMAP_HASH_THRESHOLD = 16 * 1024 * 1024
+
+# Ranges in which orjson writes ints and floats exactly as json.dumps does
+_ORJSON_INT_MIN = -(1 << 63)
+_ORJSON_INT_MAX = (1 << 64) - 1
+_FLOAT_REPR_MIN = 1e-4
+_FLOAT_REPR_MAX = 1e16
+
+# Parsed JSON keyed by absolute path: (st_mtime_ns, st_size, marshalled data).
+# marshal covers every type json.loads returns and rebuilds a fresh object
+# faster than re-parsing the file or deep-copying the cached data.
+_json_cache: Dict[str, Tuple[int, int, bytes]] = {}
+
+# Keyword count from which group_similar_keywords builds a sparse matrix;
+# below it the inverted-index loop is faster than the matrix setup
+_SPARSE_JACCARD_MIN_KEYWORDS = 500
+
+# Linux ioctl request that reflinks one file's extents into another
+_FICLONE = 0x40049409
+
+# Common resume section headers
+_SECTION_END = r'(?=\n\s*\n|\n\s*[A-Z]|\Z)'
+_SECTION_PATTERNS = tuple(
+    (name, re.compile(header + r'\s*:?\s*\n(.*?)' + _SECTION_END, re.IGNORECASE | re.DOTALL))
+    for name, header in (
+        ('summary', r'(summary|profile|objective|about)'),
+        ('experience', r'(experience|work\s+history|employment)'),
+        ('education', r'(education|academic|qualifications)'),
+        ('skills', r'(skills|technical\s+skills|competencies)'),
+        ('projects', r'(projects|portfolio|achievements)'),
+    )
+)
+
+
 def clean_text(text: str) -> str:
     """
     Clean and normalize text for processing.
@@ -31,13 +94,13 @@ def clean_text(text: str) -> str:
         return ""
     
     # Remove extra whitespace
-    text = re.sub(r'\s+', ' ', text)
+    text = _WS_RE.sub(' ', text)
     
     # Remove special characters that might interfere with analysis
-    text = re.sub(r'[^\w\s\-\.\,\;\:\!\?\(\)\[\]\{\}]', ' ', text)
+    text = _SPECIAL_RE.sub(' ', text)
     
     # Normalize line breaks
-    text = re.sub(r'\n+', '\n', text)
+    text = _NL_RE.sub('\n', text)
     
     # Strip leading/trailing whitespace
     text = text.strip()
@@ -64,24 +127,18 @@ def extract_text_sections(text: str) -> Dict[str, str]:
         'other': ''
     }
     
-    # Common section headers
-    section_patterns = {
-        'summary': r'(summary|profile|objective|about)\s*:?\s*\n(.*?)(?=\n\s*\n|\n\s*[A-Z]|\Z)',
-        'experience': r'(experience|work\s+history|employment)\s*:?\s*\n(.*?)(?=\n\s*\n|\n\s*[A-Z]|\Z)',
-        'education': r'(education|academic|qualifications)\s*:?\s*\n(.*?)(?=\n\s*\n|\n\s*[A-Z]|\Z)',
-        'skills': r'(skills|technical\s+skills|competencies)\s*:?\s*\n(.*?)(?=\n\s*\n|\n\s*[A-Z]|\Z)',
-        'projects': r'(projects|portfolio|achievements)\s*:?\s*\n(.*?)(?=\n\s*\n|\n\s*[A-Z]|\Z)'
-    }
+    found = False
     
-    text_lower = text.lower()
-    
-    for section_name, pattern in section_patterns.items():
-        matches = re.findall(pattern, text_lower, re.IGNORECASE | re.DOTALL)
-        if matches:
-            sections[section_name] = matches[0][1].strip()
+    # Patterns are case-insensitive, so the original text keeps its casing
+    for section_name, pattern in _SECTION_PATTERNS:
+        match = pattern.search(text)
+        if match:
+            content = match.group(2).strip()
+            sections[section_name] = content
+            found = found or bool(content)
     
     # If no sections found, put everything in 'other'
-    if not any(sections.values()):
+    if not found:
         sections['other'] = text
     
     return sections
@@ -111,15 +168,22 @@ def calculate_text_statistics(text: str) -> Dict[str, Any]:
     # Basic counts
     characters = len(text)
     words = len(text.split())
-    sentences = len(re.split(r'[.!?]+', text))
-    paragraphs = len([p for p in text.split('\n\n') if p.strip()])
-    
-    # Word analysis
-    word_list = re.findall(r'\b\w+\b', text.lower())
-    unique_words = len(set(word_list))
+    sentences = sum(1 for _ in _SENT_RE.finditer(text)) + 1
+    paragraphs = sum(1 for p in text.split('\n\n') if p and not p.isspace())
+    
+    # Word analysis in a single scan, without materializing a word list
+    seen_words = set()
+    word_count = 0
+    total_word_length = 0
+    for match in _WORD_RE.finditer(text.lower()):
+        word = match.group()
+        seen_words.add(word)
+        word_count += 1
+        total_word_length += len(word)
+    unique_words = len(seen_words)
     
     # Averages
-    average_word_length = sum(len(word) for word in word_list) / len(word_list) if word_list else 0
+    average_word_length = total_word_length / word_count if word_count else 0
     average_sentence_length = words / sentences if sentences > 0 else 0
     
     return {
@@ -133,10 +197,13 @@ def calculate_text_statistics(text: str) -> Dict[str, Any]:
     }
 
 
+@lru_cache(maxsize=8192)
 def normalize_keyword(keyword: str) -> str:
     """
     Normalize a keyword for consistent matching.
     
+    Results are memoized, since the same keywords recur across analyses.
+    
     Args:
         keyword (str): Raw keyword
         
@@ -150,10 +217,10 @@ def normalize_keyword(keyword: str) -> str:
     normalized = keyword.lower()
     
     # Remove extra whitespace
-    normalized = re.sub(r'\s+', ' ', normalized)
+    normalized = _WS_RE.sub(' ', normalized)
     
     # Remove special characters but keep important ones
-    normalized = re.sub(r'[^\w\s\-\.]', ' ', normalized)
+    normalized = _NORM_SPECIAL_RE.sub(' ', normalized)
     
     # Strip leading/trailing whitespace
     normalized = normalized.strip()
@@ -161,6 +228,20 @@ def normalize_keyword(keyword: str) -> str:
     return normalized
 
 
+@lru_cache(maxsize=4096)
+def _token_set(text: str) -> frozenset:
+    """
+    Get the normalized word set of a text, memoized for pairwise comparisons.
+    
+    Args:
+        text (str): Text to tokenize
+        
+    Returns:
+        frozenset: Normalized words
+    """
+    return frozenset(normalize_keyword(text).split())
+
+
 def calculate_similarity(text1: str, text2: str) -> float:
     """
     Calculate similarity between two text strings.
@@ -175,23 +256,99 @@ def calculate_similarity(text1: str, text2: str) -> float:
     if not text1 or not text2:
         return 0.0
     
-    # Normalize texts
-    text1_norm = normalize_keyword(text1)
-    text2_norm = normalize_keyword(text2)
-    
-    # Calculate Jaccard similarity
-    words1 = set(text1_norm.split())
-    words2 = set(text2_norm.split())
+    # Calculate Jaccard similarity on cached token sets
+    words1 = _token_set(text1)
+    words2 = _token_set(text2)
     
     if not words1 and not words2:
         return 1.0
     if not words1 or not words2:
         return 0.0
     
-    intersection = len(words1.intersection(words2))
-    union = len(words1.union(words2))
+    intersection = len(words1 & words2)
+    return intersection / (len(words1) + len(words2) - intersection)
+
+
+def _similar_keywords_indexed(token_sets: List[frozenset], threshold: float) -> List[List[int]]:
+    """
+    Find similar keyword pairs using an inverted token index.
+    
+    Args:
+        token_sets (List[frozenset]): Token set of each keyword
+        threshold (float): Minimum Jaccard similarity
+        
+    Returns:
+        List[List[int]]: For each keyword, ascending later indices that meet the threshold
+    """
+    token_index = defaultdict(list)
+    for i, tokens in enumerate(token_sets):
+        for token in tokens:
+            token_index[token].append(i)
+    
+    similar = []
+    for i, tokens1 in enumerate(token_sets):
+        candidates = set()
+        for token in tokens1:
+            candidates.update(token_index[token])
+        
+        matches = []
+        for j in sorted(candidates):
+            if j <= i:
+                continue
+            tokens2 = token_sets[j]
+            intersection = len(tokens1 & tokens2)
+            if intersection / (len(tokens1) + len(tokens2) - intersection) >= threshold:
+                matches.append(j)
+        similar.append(matches)
+    
+    return similar
+
+
+def _similar_keywords_sparse(token_sets: List[frozenset], threshold: float) -> Optional[List[List[int]]]:
+    """
+    Find similar keyword pairs with a sparse keyword-by-token matrix.
+    
+    Intersection sizes for every pair come from one sparse product M @ M.T,
+    and unions from the row sums, so the pairwise work runs in C. numpy and
+    scipy are imported here so that importing this module stays cheap.
+    
+    Args:
+        token_sets (List[frozenset]): Token set of each keyword
+        threshold (float): Minimum Jaccard similarity
+        
+    Returns:
+        Optional[List[List[int]]]: For each keyword, ascending later indices
+            that meet the threshold, or None if scipy is not installed
+    """
+    try:
+        import numpy as np
+        from scipy import sparse
+    except ImportError:
+        return None
+    
+    columns = {}
+    rows = []
+    cols = []
+    for i, tokens in enumerate(token_sets):
+        for token in tokens:
+            rows.append(i)
+            cols.append(columns.setdefault(token, len(columns)))
     
-    return intersection / union
+    count = len(token_sets)
+    matrix = sparse.csr_matrix(
+        (np.ones(len(rows), dtype=np.int32), (rows, cols)), shape=(count, len(columns))
+    )
+    overlap = sparse.triu(matrix @ matrix.T, k=1).tocoo()
+    sizes = np.asarray(matrix.sum(axis=1)).ravel()
+    
+    union = sizes[overlap.row] + sizes[overlap.col] - overlap.data
+    keep = overlap.data / union >= threshold
+    
+    similar = [[] for _ in range(count)]
+    for i, j in sorted(zip(overlap.row[keep].tolist(), overlap.col[keep].tolist())):
+        similar[i].append(j)
+    
+    return similar
 
 
 def group_similar_keywords(keywords: List[str], threshold: float = 0.8) -> List[List[str]]:
@@ -208,6 +365,25 @@ def group_similar_keywords(keywords: List[str], threshold: float = 0.8) -> List[
     if not keywords:
         return []
     
+    # Every pair scores at least 0.0, so a non-positive threshold groups everything
+    if threshold <= 0:
+        return [list(keywords)]
+    
+    # Tokenize each keyword once. Keywords that normalize to no tokens get a
+    # shared None token, matching calculate_similarity's 1.0 for that case.
+    token_sets = []
+    for keyword in keywords:
+        if not keyword:
+            token_sets.append(frozenset())
+        else:
+            token_sets.append(_token_set(keyword) or frozenset((None,)))
+    
+    similar = None
+    if len(keywords) >= _SPARSE_JACCARD_MIN_KEYWORDS:
+        similar = _similar_keywords_sparse(token_sets, threshold)
+    if similar is None:
+        similar = _similar_keywords_indexed(token_sets, threshold)
+    
     groups = []
     used = set()
     
@@ -218,13 +394,9 @@ def group_similar_keywords(keywords: List[str], threshold: float = 0.8) -> List[
         group = [keyword1]
         used.add(i)
         
-        for j, keyword2 in enumerate(keywords[i+1:], i+1):
-            if j in used:
-                continue
-            
-            similarity = calculate_similarity(keyword1, keyword2)
-            if similarity >= threshold:
-                group.append(keyword2)
+        for j in similar[i]:
+            if j not in used:
+                group.append(keywords[j])
                 used.add(j)
         
         groups.append(group)
@@ -244,14 +416,17 @@ def format_file_size(size_bytes: int) -> str:
     """
     if size_bytes == 0:
         return "0 B"
+    if size_bytes < 1024:
+        return f"{size_bytes:.1f} B"
     
-    size_names = ["B", "KB", "MB", "GB", "TB"]
-    i = 0
-    while size_bytes >= 1024 and i < len(size_names) - 1:
-        size_bytes /= 1024.0
-        i += 1
+    # NaN never reaches a unit and infinity reaches the largest one, as in a division loop
+    if isinstance(size_bytes, float) and not math.isfinite(size_bytes):
+        unit = "B" if math.isnan(size_bytes) else _SIZE_UNITS[-1]
+        return f"{size_bytes:.1f} {unit}"
     
-    return f"{size_bytes:.1f} {size_names[i]}"
+    # floor(log2(size)) // 10 picks the unit directly; bit_length keeps it exact
+    i = min((int(size_bytes).bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+    return f"{size_bytes / (1 << (10 * i)):.1f} {_SIZE_UNITS[i]}"
 
 
 def format_duration(seconds: float) -> str:
@@ -297,18 +472,89 @@ def generate_unique_filename(base_name: str, extension: str, directory: str = ""
     if not extension.startswith('.'):
         extension = '.' + extension
     
+    # List the directory once and probe candidates in memory
+    try:
+        existing = set(os.listdir(directory or '.'))
+    except OSError:
+        existing = set()
+    
     filename = base_name + extension
     counter = 1
     
     while True:
-        full_path = Path(directory) / filename if directory else Path(filename)
-        if not full_path.exists():
-            return str(full_path)
+        if filename not in existing:
+            full_path = Path(directory) / filename if directory else Path(filename)
+            # Confirm on disk, since the listing is case-sensitive even where
+            # the filesystem is not
+            if not full_path.exists():
+                return str(full_path)
         
         filename = f"{base_name}_{counter}{extension}"
         counter += 1
 
 
+def _is_orjson_exact(data: Any) -> bool:
+    """
+    Check that orjson would encode data byte-for-byte like json.dumps.
+    
+    That holds for str-keyed dicts, lists, tuples, str, bool, None, ints in
+    orjson's 64-bit range, and floats that repr() writes without an exponent.
+    Anything else (including subclasses such as Enum members) is left to json.
+    
+    Args:
+        data (Any): Data to check
+        
+    Returns:
+        bool: True if the orjson output matches json.dumps
+    """
+    stack = [data]
+    while stack:
+        obj = stack.pop()
+        obj_type = type(obj)
+        if obj_type is str or obj_type is bool or obj is None:
+            continue
+        if obj_type is int:
+            if _ORJSON_INT_MIN <= obj <= _ORJSON_INT_MAX:
+                continue
+            return False
+        if obj_type is float:
+            # NaN fails both comparisons; orjson would write it as null
+            if obj == 0.0 or _FLOAT_REPR_MIN <= abs(obj) < _FLOAT_REPR_MAX:
+                continue
+            return False
+        if obj_type is dict:
+            for key in obj:
+                if type(key) is not str:
+                    return False
+            stack.extend(obj.values())
+            continue
+        if obj_type is list or obj_type is tuple:
+            stack.extend(obj)
+            continue
+        return False
+    return True
+
+
+def _encode_json(data: Any, indent: Optional[int]) -> bytes:
+    """
+    Encode data as UTF-8 JSON, identical to json.dumps(..., ensure_ascii=False, default=str).
+    
+    orjson is used for the default 2-space layout when _is_orjson_exact
+    confirms its output would be the same; json.dumps handles the rest.
+    
+    Args:
+        data (Any): Data to encode
+        indent (Optional[int]): JSON indentation
+        
+    Returns:
+        bytes: Encoded JSON
+    """
+    if ORJSON_AVAILABLE and indent == 2 and _is_orjson_exact(data):
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    
+    return json.dumps(data, indent=indent, ensure_ascii=False, default=str).encode('utf-8')
+
+
 def save_json_data(data: Any, file_path: Union[str, Path], indent: int = 2) -> bool:
     """
     Save data to JSON file with error handling.
@@ -325,9 +571,9 @@ def save_json_data(data: Any, file_path: Union[str, Path], indent: int = 2) -> b
         path = Path(file_path)
         path.parent.mkdir(parents=True, exist_ok=True)
         
-        with open(path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=indent, ensure_ascii=False, default=str)
+        path.write_bytes(_encode_json(data, indent))
         
+        _invalidate_json_cache(path)
         return True
     except Exception as e:
         logging.error(f"Error saving JSON data: {e}")
@@ -338,6 +584,9 @@ def load_json_data(file_path: Union[str, Path]) -> Optional[Any]:
     """
     Load data from JSON file with error handling.
     
+    Parsed data is cached until the file's modification time or size
+    changes. Each call returns a new object, so callers may mutate it.
+    
     Args:
         file_path (Union[str, Path]): Input file path
         
@@ -346,22 +595,59 @@ def load_json_data(file_path: Union[str, Path]) -> Optional[Any]:
     """
     try:
         path = Path(file_path)
-        if not path.exists():
+        key = os.path.abspath(path)
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            _json_cache.pop(key, None)
             return None
         
-        with open(path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        entry = _json_cache.get(key)
+        if entry is not None and entry[0] == st.st_mtime_ns and entry[1] == st.st_size:
+            return marshal.loads(entry[2])
+        
+        raw = path.read_bytes()
+        # json rather than orjson: orjson turns integers wider than 64 bits
+        # into floats and rejects the NaN literals json.dumps writes
+        data = json.loads(raw)
+        
+        try:
+            _json_cache[key] = (st.st_mtime_ns, st.st_size, marshal.dumps(data))
+        except ValueError:
+            # Nested too deeply for marshal; just don't cache it
+            _json_cache.pop(key, None)
+        return data
     except Exception as e:
         logging.error(f"Error loading JSON data: {e}")
         return None
 
 
-def calculate_hash(data: Union[str, bytes]) -> str:
+def _invalidate_json_cache(file_path: Optional[Union[str, Path]] = None) -> None:
+    """
+    Drop cached JSON data for one file, or for all files.
+    
+    Args:
+        file_path (Optional[Union[str, Path]]): File to forget, or None for all
+    """
+    if file_path is None:
+        _json_cache.clear()
+    else:
+        _json_cache.pop(os.path.abspath(file_path), None)
+
+
+load_json_data.invalidate = _invalidate_json_cache
+
+
+def calculate_hash(data: Union[str, bytes], *, fast: bool = True) -> str:
     """
-    Calculate SHA-256 hash of data.
+    Calculate a hash of data.
+    
+    The fast default is a 128-bit BLAKE2b digest, meant for deduplication
+    and cache keys only, not for signing or integrity checks.
     
     Args:
         data (Union[str, bytes]): Data to hash
+        fast (bool): Use BLAKE2b; pass False for a SHA-256 digest
         
     Returns:
         str: Hexadecimal hash string
@@ -369,6 +655,8 @@ def calculate_hash(data: Union[str, bytes]) -> str:
     if isinstance(data, str):
         data = data.encode('utf-8')
     
+    if fast:
+        return hashlib.blake2b(data, digest_size=16).hexdigest()
     return hashlib.sha256(data).hexdigest()
 
 
@@ -383,21 +671,77 @@ def get_file_hash(file_path: Union[str, Path]) -> Optional[str]:
         Optional[str]: File hash or None if failed
     """
     try:
-        path = Path(file_path)
-        if not path.exists():
+        try:
+            f = open(file_path, "rb", buffering=0)
+        except FileNotFoundError:
             return None
         
-        hash_sha256 = hashlib.sha256()
-        with open(path, "rb") as f:
-            for chunk in iter(lambda: f.read(4096), b""):
+        with f:
+            # Large files are hashed from a read-only mapping in one update
+            if os.fstat(f.fileno()).st_size > _MMAP_HASH_THRESHOLD:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    return hashlib.sha256(mapped).hexdigest()
+            
+            # Python 3.11+ hashes straight from the file descriptor in C
+            if hasattr(hashlib, 'file_digest'):
+                return hashlib.file_digest(f, 'sha256').hexdigest()
+            
+            hash_sha256 = hashlib.sha256()
+            while chunk := f.read(_HASH_CHUNK_SIZE):
                 hash_sha256.update(chunk)
-        
-        return hash_sha256.hexdigest()
+            
+            return hash_sha256.hexdigest()
     except Exception as e:
         logging.error(f"Error calculating file hash: {e}")
         return None
 
 
+def _clone_file(source: Path, destination: Path) -> bool:
+    """
+    Copy a file's contents without passing the data through Python.
+    
+    Tries a copy-on-write reflink (FICLONE) first, which shares extents on
+    btrfs/XFS, then os.copy_file_range. Linux only.
+    
+    Args:
+        source (Path): File to copy
+        destination (Path): File to create or overwrite
+        
+    Returns:
+        bool: True if the contents were copied in full, False to fall back to shutil
+    """
+    if not sys.platform.startswith('linux'):
+        return False
+    
+    import fcntl
+    
+    with open(source, 'rb') as src, open(destination, 'wb') as dst:
+        try:
+            fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+            return True
+        except OSError:
+            pass
+        
+        if not hasattr(os, 'copy_file_range'):
+            return False
+        
+        try:
+            remaining = os.fstat(src.fileno()).st_size
+            # Files such as those in /proc report size 0 but have contents
+            if remaining == 0:
+                return False
+            while remaining > 0:
+                copied = os.copy_file_range(src.fileno(), dst.fileno(), remaining)
+                if copied == 0:
+                    break
+                remaining -= copied
+        except OSError:
+            return False
+        
+        # A short copy (e.g. the file shrank) is left for shutil to redo
+        return remaining == 0
+
+
 def create_backup(file_path: Union[str, Path], backup_dir: str = "backups") -> Optional[str]:
     """
     Create a backup of a file.
@@ -423,9 +767,11 @@ def create_backup(file_path: Union[str, Path], backup_dir: str = "backups") -> O
         backup_filename = f"{path.stem}_{timestamp}{path.suffix}"
         backup_file_path = backup_path / backup_filename
         
-        # Copy file
-        import shutil
-        shutil.copy2(path, backup_file_path)
+        # Copy file, letting the kernel clone or copy the data when it can
+        if _clone_file(path, backup_file_path):
+            shutil.copystat(path, backup_file_path)
+        else:
+            shutil.copy2(path, backup_file_path)
         
         return str(backup_file_path)
     except Exception as e:
@@ -433,27 +779,47 @@ def create_backup(file_path: Union[str, Path], backup_dir: str = "backups") -> O
         return None
 
 
-def get_system_info() -> Dict[str, Any]:
+@lru_cache(maxsize=1)
+def _static_system_info() -> Dict[str, Any]:
     """
-    Get system information for debugging and logging.
+    Get system fields that do not change during the process lifetime.
     
     Returns:
-        Dict[str, Any]: System information
+        Dict[str, Any]: Platform and Python information
     """
     import platform
-    import psutil
     
+    return {
+        'platform': platform.system(),
+        'platform_version': platform.version(),
+        'architecture': platform.architecture()[0],
+        'processor': platform.processor(),
+        'python_version': platform.python_version()
+    }
+
+
+def get_system_info(live: bool = True) -> Dict[str, Any]:
+    """
+    Get system information for debugging and logging.
+    
+    Args:
+        live (bool): Whether to include current memory and disk usage
+        
+    Returns:
+        Dict[str, Any]: System information
+    """
     try:
-        return {
-            'platform': platform.system(),
-            'platform_version': platform.version(),
-            'architecture': platform.architecture()[0],
-            'processor': platform.processor(),
-            'python_version': platform.python_version(),
-            'memory_total': psutil.virtual_memory().total,
-            'memory_available': psutil.virtual_memory().available,
-            'disk_usage': psutil.disk_usage('/').percent if platform.system() != 'Windows' else psutil.disk_usage('C:\\').percent
-        }
+        info = dict(_static_system_info())
+        if not live:
+            return info
+        
+        import psutil
+        
+        memory = psutil.virtual_memory()
+        info['memory_total'] = memory.total
+        info['memory_available'] = memory.available
+        info['disk_usage'] = psutil.disk_usage('C:\\' if info['platform'] == 'Windows' else '/').percent
+        return info
     except Exception as e:
         logging.error(f"Error getting system info: {e}")
         return {}
@@ -528,10 +894,8 @@ def safe_filename(filename: str) -> str:
     Returns:
         str: Safe filename
     """
-    # Remove or replace invalid characters
-    invalid_chars = '<>:"/\\|?*'
-    for char in invalid_chars:
-        filename = filename.replace(char, '_')
+    # Replace invalid characters in a single pass
+    filename = filename.translate(FILENAME_SANITIZE_TABLE)
     
     # Remove leading/trailing spaces and dots
     filename = filename.strip(' .')
@@ -541,10 +905,7 @@ def safe_filename(filename: str) -> str:
         filename = 'untitled'
     
     # Limit length
-    if len(filename) > 255:
-        filename = filename[:255]
-    
-    return filename
+    return filename[:255]
 
 
 def chunk_list(lst: List[Any], chunk_size: int) -> List[List[Any]]:
@@ -572,11 +933,18 @@ def flatten_list(nested_list: List[Any]) -> List[Any]:
         List[Any]: Flattened list
     """
     flattened = []
-    for item in nested_list:
-        if isinstance(item, list):
-            flattened.extend(flatten_list(item))
-        else:
+    stack = [iter(nested_list)]
+    
+    # Walk with an explicit stack of iterators instead of recursing
+    while stack:
+        for item in stack[-1]:
+            if isinstance(item, list):
+                stack.append(iter(item))
+                break
             flattened.append(item)
+        else:
+            stack.pop()
+    
     return flattened
 
 
@@ -590,10 +958,5 @@ def remove_duplicates_preserve_order(lst: List[Any]) -> List[Any]:
     Returns:
         List[Any]: List with duplicates removed
     """
-    seen = set()
-    result = []
-    for item in lst:
-        if item not in seen:
-            seen.add(item)
-            result.append(item)
-    return result 
\ No newline at end of file
+    # dicts keep insertion order, so this dedupes in a single C-level pass
+    return list(dict.fromkeys(lst)) 
\ No newline at end of file
@@ -7,53 +7,142 @@ Provides centralized logging configuration for the EasyApply application.
 import logging
 import logging.handlers
 import sys
+import threading
 from pathlib import Path
 from datetime import datetime
 
 
+# Settings recorded by setup_logging; handlers are built from them on first use
+_pending_config = None
+_configured = False
+_configure_lock = threading.Lock()
+
+# Handlers this module has attached to the root logger
+_handlers = []
+
+
+class _DeferredSetupHandler(logging.Handler):
+    """Root placeholder that builds the real handlers on the first record."""
+    
+    def emit(self, record):
+        try:
+            log_file, error = _configure_once()
+        except Exception:
+            self.handleError(record)
+            return
+        
+        # Hand the triggering record to the handlers that replaced this one
+        for handler in list(_handlers):
+            if handler is not self and record.levelno >= handler.level:
+                handler.handle(record)
+        
+        # Reported after the triggering record so timestamps stay in order
+        if error is not None:
+            logging.warning(f"Could not create log file {log_file}: {error}; logging to console only")
+        elif log_file is not None:
+            logging.info(f"Logging initialized. Log file: {log_file}")
+
+
+def _configure_once():
+    """
+    Create the file and console handlers recorded by setup_logging.
+    
+    If the log directory cannot be created, only the console handler is
+    installed so that logging calls keep working.
+    
+    Returns:
+        tuple: (log_file, error) when this call installed the handlers,
+            where error is the OSError that prevented file logging or None;
+            (None, None) if there was nothing to do
+    """
+    global _configured
+    
+    with _configure_lock:
+        if _configured or _pending_config is None:
+            return None, None
+        log_level, log_file = _pending_config
+        
+        # Create formatter
+        formatter = logging.Formatter(
+            '%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s'
+        )
+        
+        # Create console handler
+        console_handler = logging.StreamHandler(sys.stdout)
+        console_handler.setLevel(log_level)
+        console_handler.setFormatter(formatter)
+        new_handlers = [console_handler]
+        
+        error = None
+        try:
+            # Create logs directory if it doesn't exist
+            Path(log_file).parent.mkdir(parents=True, exist_ok=True)
+        except OSError as e:
+            error = e
+        else:
+            # Create file handler with rotation; the file is opened on first write
+            file_handler = logging.handlers.RotatingFileHandler(
+                log_file, maxBytes=10*1024*1024, backupCount=5, delay=True
+            )
+            file_handler.setLevel(log_level)
+            file_handler.setFormatter(formatter)
+            new_handlers.insert(0, file_handler)
+        
+        # Swap in a new list rather than mutating in place, since the root
+        # logger may be iterating its handlers while this runs
+        root_logger = logging.getLogger()
+        root_logger.handlers = [
+            h for h in root_logger.handlers if h not in _handlers
+        ] + new_handlers
+        _handlers[:] = new_handlers
+        _configured = True
+    
+    return log_file, error
+
+
 def setup_logging(log_level=logging.INFO, log_file=None):
     """
     Set up application logging with both file and console handlers.
     
+    The handlers are created when the first record is logged, so no
+    directory or file is touched until logging is actually used. Calling
+    this again with the same settings is a no-op; different settings
+    replace the handlers from the earlier call.
+    
     Args:
         log_level (int): Logging level (default: logging.INFO)
         log_file (str, optional): Path to log file. If None, uses default location.
     """
-    # Create logs directory if it doesn't exist
-    if log_file is None:
-        log_dir = Path("logs")
-        log_dir.mkdir(exist_ok=True)
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        log_file = log_dir / f"easyapply_{timestamp}.log"
+    global _pending_config, _configured
     
-    # Create formatter
-    formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s'
-    )
+    # Already set up with these settings; adding handlers again would
+    # write every record more than once
+    if _pending_config is not None and log_level == _pending_config[0] and (
+        log_file is None or str(log_file) == str(_pending_config[1])
+    ):
+        return
     
-    # Create file handler with rotation
-    file_handler = logging.handlers.RotatingFileHandler(
-        log_file, maxBytes=10*1024*1024, backupCount=5
-    )
-    file_handler.setLevel(log_level)
-    file_handler.setFormatter(formatter)
-    
-    # Create console handler
-    console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(log_level)
-    console_handler.setFormatter(formatter)
+    if log_file is None:
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        log_file = Path("logs") / f"easyapply_{timestamp}.log"
     
-    # Configure root logger
+    # Configure root logger, replacing handlers from an earlier call
     root_logger = logging.getLogger()
+    placeholder = _DeferredSetupHandler(log_level)
+    with _configure_lock:
+        for handler in _handlers:
+            root_logger.removeHandler(handler)
+            handler.close()
+        _handlers[:] = [placeholder]
+        _pending_config = (log_level, log_file)
+        _configured = False
+    
     root_logger.setLevel(log_level)
-    root_logger.addHandler(file_handler)
-    root_logger.addHandler(console_handler)
+    root_logger.addHandler(placeholder)
     
     # Set specific logger levels
     logging.getLogger('PySide6').setLevel(logging.WARNING)
     logging.getLogger('matplotlib').setLevel(logging.WARNING)
-    
-    logging.info(f"Logging initialized. Log file: {log_file}")
 
 
 def get_logger(name):
@@ -66,4 +155,4 @@ def get_logger(name):
     Returns:
         logging.Logger: Configured logger instance
     """
-    return logging.getLogger(name) 
\ No newline at end of file
+    return logging.getLogger(name)
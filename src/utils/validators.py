@@ -5,19 +5,55 @@ Contains validation functions for file handling, input validation,
 and data integrity checks throughout the application.
 """
 
+import errno
 import os
 import re
+import stat
+import threading
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Union, List, Dict, Any, Optional
+from typing import Union, List, Dict, Any, Optional, Tuple
 import logging
 
 from src.utils.constants import (
-    SUPPORTED_RESUME_FORMATS, PDF_MAX_SIZE_MB,
+    SUPPORTED_RESUME_FORMATS, PDF_MAX_SIZE_MB, FILENAME_SANITIZE_TABLE,
     MIN_KEYWORD_LENGTH, MAX_KEYWORD_LENGTH
 )
 from src.utils.logger import get_logger
 
 
+# validate_pdf_file verdicts keyed by absolute path: (size, mtime_ns, ctime_ns), verdict
+_PDF_CACHE_MAX_ENTRIES = 128
+_pdf_validation_cache: Dict[str, Tuple[Tuple[int, int, int], Dict[str, Any]]] = {}
+_pdf_cache_lock = threading.Lock()
+
+# stat errors Path.exists() treats as a missing file
+_MISSING_FILE_ERRNOS = frozenset((errno.ENOENT, errno.ENOTDIR, errno.EBADF, errno.ELOOP))
+
+# Batches smaller than this are validated serially
+_PDF_BATCH_PARALLEL_MIN = 8
+_PDF_BATCH_MAX_WORKERS = 16
+
+# Types json encodes directly (also the types it accepts as dict keys)
+_JSON_ATOMIC = (str, int, float, bool, type(None))
+
+# Check access as the effective user where the platform supports it
+_ACCESS_EFFECTIVE_IDS = os.access in os.supports_effective_ids
+
+# Precompiled validation patterns
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+_URL_RE = re.compile(r'^https?://[^\s/$.?#].[^\s]*$')
+_INVALID_KW_RE = re.compile(r'[^\w\s\-\.\,\;\:\!\?\(\)\[\]\{\}]')
+
+# Below this length str.split counts words faster than the numpy scan
+_NUMPY_WORD_COUNT_MIN_CHARS = 10000
+
+# Compact keyword verdict; validate_keyword turns it into a result dict
+_KeywordResult = namedtuple('_KeywordResult', 'valid cleaned errors warnings')
+
+
 def validate_file_path(file_path: Union[str, Path]) -> bool:
     """
     Validate if a file path exists and is accessible.
@@ -28,9 +64,12 @@ def validate_file_path(file_path: Union[str, Path]) -> bool:
     Returns:
         bool: True if file is valid, False otherwise
     """
+    # Reject ints explicitly: os.path.isfile would treat them as descriptors
+    if not isinstance(file_path, (str, os.PathLike)):
+        return False
+    
     try:
-        path = Path(file_path)
-        return path.exists() and path.is_file()
+        return os.path.isfile(file_path)
     except Exception:
         return False
 
@@ -47,16 +86,26 @@ def validate_file_size(file_path: Union[str, Path], max_size_mb: float = PDF_MAX
         bool: True if file size is acceptable, False otherwise
     """
     try:
-        path = Path(file_path)
-        if not path.exists():
-            return False
-        
-        file_size_mb = path.stat().st_size / (1024 * 1024)
-        return file_size_mb <= max_size_mb
+        return os.stat(os.fspath(file_path)).st_size <= max_size_mb * 1024 * 1024
     except Exception:
         return False
 
 
+@lru_cache(maxsize=256)
+def _ext_allowed(suffix: str, allowed_formats: frozenset) -> bool:
+    """
+    Check a raw file extension against allowed formats, case-insensitively.
+    
+    Args:
+        suffix (str): Extension as it appears in the path
+        allowed_formats (frozenset): Allowed lowercase extensions
+        
+    Returns:
+        bool: True if the extension is allowed
+    """
+    return suffix.lower() in allowed_formats
+
+
 def validate_file_format(file_path: Union[str, Path], 
                         allowed_formats: List[str] = None) -> bool:
     """
@@ -73,12 +122,118 @@ def validate_file_format(file_path: Union[str, Path],
         allowed_formats = SUPPORTED_RESUME_FORMATS
     
     try:
-        path = Path(file_path)
-        return path.suffix.lower() in allowed_formats
+        if not isinstance(allowed_formats, frozenset):
+            allowed_formats = frozenset(allowed_formats)
+        return _ext_allowed(os.path.splitext(os.fspath(file_path))[1], allowed_formats)
     except Exception:
         return False
 
 
+def _read_header(path: Union[str, bytes], size: int) -> bytes:
+    """
+    Read the first bytes of a file without creating a buffered file object.
+    
+    Args:
+        path (Union[str, bytes]): File path
+        size (int): Number of bytes to read
+        
+    Returns:
+        bytes: Up to size bytes from the start of the file
+    """
+    fd = os.open(path, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+    try:
+        return os.read(fd, size)
+    finally:
+        os.close(fd)
+
+
+def _check_pdf_contents(path: str, st: os.stat_result, result: Dict[str, Any]) -> bool:
+    """
+    Run the format, size and signature checks on a regular file.
+    
+    Args:
+        path (str): Path to the file
+        st (os.stat_result): Stat result for the file
+        result (Dict[str, Any]): Validation result to fill in
+        
+    Returns:
+        bool: False if the file could not be read, so the verdict should not be cached
+    """
+    # Check file format
+    if os.path.splitext(path)[1].lower() != '.pdf':
+        result['errors'].append("File is not a PDF")
+        return True
+    
+    # Check file size
+    if st.st_size > PDF_MAX_SIZE_MB * 1024 * 1024:
+        result['errors'].append(f"File size exceeds {PDF_MAX_SIZE_MB} MB limit")
+        return True
+    
+    # Check if file is readable
+    try:
+        # Read first few bytes to check PDF signature, unbuffered
+        header = _read_header(path, 4)
+        if header != b'%PDF':
+            result['errors'].append("File does not appear to be a valid PDF")
+            return True
+    except Exception as e:
+        result['errors'].append(f"Cannot read file: {str(e)}")
+        return False
+    
+    # Check file size for warnings
+    if st.st_size > 10 * 1024 * 1024:  # Warning for files larger than 10MB
+        file_size_mb = st.st_size / (1024 * 1024)
+        result['warnings'].append(f"Large file size ({file_size_mb:.1f} MB) may slow processing")
+    
+    result['valid'] = True
+    return True
+
+
+def _validate_pdf_stat(path: str, st: os.stat_result, result: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Validate a PDF from its stat result, reusing the verdict for unchanged files.
+    
+    Args:
+        path (str): Path to the file
+        st (os.stat_result): Stat result for the file
+        result (Dict[str, Any]): Validation result to fill in
+        
+    Returns:
+        Dict[str, Any]: Validation results with details
+    """
+    # Check if it's a file
+    if not stat.S_ISREG(st.st_mode):
+        result['errors'].append("Path is not a file")
+        return result
+    
+    # ctime is included so permission changes also invalidate the entry
+    key = os.path.abspath(path)
+    signature = (st.st_size, st.st_mtime_ns, st.st_ctime_ns)
+    with _pdf_cache_lock:
+        cached = _pdf_validation_cache.get(key)
+    if cached is not None and cached[0] == signature:
+        verdict = cached[1]
+        result['valid'] = verdict['valid']
+        result['errors'].extend(verdict['errors'])
+        result['warnings'].extend(verdict['warnings'])
+        return result
+    
+    if not _check_pdf_contents(path, st, result):
+        return result
+    
+    verdict = {
+        'valid': result['valid'],
+        'errors': tuple(result['errors']),
+        'warnings': tuple(result['warnings'])
+    }
+    with _pdf_cache_lock:
+        _pdf_validation_cache.pop(key, None)
+        if len(_pdf_validation_cache) >= _PDF_CACHE_MAX_ENTRIES:
+            del _pdf_validation_cache[next(iter(_pdf_validation_cache))]
+        _pdf_validation_cache[key] = (signature, verdict)
+    return result
+
+
 def validate_pdf_file(file_path: Union[str, Path]) -> Dict[str, Any]:
     """
     Comprehensive PDF file validation.
@@ -96,46 +251,63 @@ def validate_pdf_file(file_path: Union[str, Path]) -> Dict[str, Any]:
     }
     
     try:
-        path = Path(file_path)
+        path = os.fspath(file_path)
         
-        # Check if file exists
-        if not path.exists():
+        # Check if file exists; this stat serves every check below
+        try:
+            st = os.stat(path)
+        except OSError as e:
+            if e.errno not in _MISSING_FILE_ERRNOS:
+                raise
             result['errors'].append("File does not exist")
             return result
-        
-        # Check if it's a file
-        if not path.is_file():
-            result['errors'].append("Path is not a file")
+        except ValueError:
+            # e.g. an embedded null byte, which Path.exists() also reports as missing
+            result['errors'].append("File does not exist")
             return result
         
-        # Check file format
-        if not validate_file_format(path, ['.pdf']):
-            result['errors'].append("File is not a PDF")
-            return result
+        _validate_pdf_stat(path, st, result)
         
-        # Check file size
-        if not validate_file_size(path):
-            result['errors'].append(f"File size exceeds {PDF_MAX_SIZE_MB} MB limit")
+    except Exception as e:
+        result['errors'].append(f"Validation error: {str(e)}")
+    
+    return result
+
+
+def validate_pdf_file_from_entry(entry: os.DirEntry) -> Dict[str, Any]:
+    """
+    Validate a PDF found by os.scandir, reusing the entry's cached metadata.
+    
+    Gives the same results as validate_pdf_file(entry.path), but files that
+    are not PDFs are rejected from the directory entry without a stat call.
+    
+    Args:
+        entry (os.DirEntry): Directory entry for the file
+        
+    Returns:
+        Dict[str, Any]: Validation results with details
+    """
+    result = {
+        'valid': False,
+        'errors': [],
+        'warnings': []
+    }
+    
+    try:
+        # is_file() is answered from the directory listing for non-symlinks
+        if entry.is_file() and os.path.splitext(entry.name)[1].lower() != '.pdf':
+            result['errors'].append("File is not a PDF")
             return result
         
-        # Check if file is readable
         try:
-            with open(path, 'rb') as f:
-                # Read first few bytes to check PDF signature
-                header = f.read(4)
-                if header != b'%PDF':
-                    result['errors'].append("File does not appear to be a valid PDF")
-                    return result
-        except Exception as e:
-            result['errors'].append(f"Cannot read file: {str(e)}")
+            st = entry.stat()
+        except OSError as e:
+            if e.errno not in _MISSING_FILE_ERRNOS:
+                raise
+            result['errors'].append("File does not exist")
             return result
         
-        # Check file size for warnings
-        file_size_mb = path.stat().st_size / (1024 * 1024)
-        if file_size_mb > 10:  # Warning for files larger than 10MB
-            result['warnings'].append(f"Large file size ({file_size_mb:.1f} MB) may slow processing")
-        
-        result['valid'] = True
+        _validate_pdf_stat(entry.path, st, result)
         
     except Exception as e:
         result['errors'].append(f"Validation error: {str(e)}")
@@ -143,6 +315,76 @@ def validate_pdf_file(file_path: Union[str, Path]) -> Dict[str, Any]:
     return result
 
 
+def validate_pdf_files_batch(file_paths: List[Union[str, Path]],
+                             max_workers: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Validate several PDF files, overlapping their stat and header reads.
+    
+    Args:
+        file_paths (List[Union[str, Path]]): Paths to the PDF files
+        max_workers (int, optional): Worker thread limit for large batches
+        
+    Returns:
+        List[Dict[str, Any]]: Validation results in the same order as file_paths
+    """
+    paths = list(file_paths)
+    if len(paths) < _PDF_BATCH_PARALLEL_MIN:
+        return [validate_pdf_file(path) for path in paths]
+    
+    # The work is syscall-bound and releases the GIL, so threads overlap disk latency
+    workers = max_workers or min(_PDF_BATCH_MAX_WORKERS, len(paths))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(validate_pdf_file, paths))
+
+
+@lru_cache(maxsize=None)
+def _ascii_whitespace_table():
+    """
+    Build a byte lookup table of the ASCII characters str.split treats as whitespace.
+    
+    numpy is imported here, on first use, so importing this module stays cheap.
+    
+    Returns:
+        Optional[numpy.ndarray]: Boolean table indexed by byte, or None if numpy is not installed
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        return None
+    
+    table = np.zeros(256, dtype=bool)
+    table[list(b' \t\n\x0b\x0c\r\x1c\x1d\x1e\x1f')] = True
+    return table
+
+
+def _count_words(text: str) -> int:
+    """
+    Count whitespace-separated words, matching len(text.split()).
+    
+    Long ASCII texts are scanned as a numpy byte array, counting the
+    positions where whitespace is followed by a non-whitespace byte.
+    
+    Args:
+        text (str): Non-empty text to count words in
+        
+    Returns:
+        int: Number of words
+    """
+    # Non-ASCII text may contain Unicode whitespace the byte table misses
+    if len(text) < _NUMPY_WORD_COUNT_MIN_CHARS or not text.isascii():
+        return len(text.split())
+    
+    table = _ascii_whitespace_table()
+    if table is None:
+        return len(text.split())
+    
+    import numpy as np
+    
+    is_ws = table[np.frombuffer(text.encode('ascii'), dtype=np.uint8)]
+    word_starts = np.count_nonzero(is_ws[:-1] & ~is_ws[1:])
+    return int(word_starts) + (not is_ws[0])
+
+
 def validate_job_description(text: str) -> Dict[str, Any]:
     """
     Validate job description text.
@@ -163,25 +405,27 @@ def validate_job_description(text: str) -> Dict[str, Any]:
     
     try:
         # Check if text is provided
-        if not text or not text.strip():
+        if not text or text.isspace():
             result['errors'].append("Job description is empty")
             return result
         
         # Count characters and words
-        result['character_count'] = len(text)
-        result['word_count'] = len(text.split())
+        character_count = len(text)
+        word_count = _count_words(text)
+        result['character_count'] = character_count
+        result['word_count'] = word_count
         
         # Check minimum length
-        if result['word_count'] < 10:
+        if word_count < 10:
             result['errors'].append("Job description is too short (minimum 10 words)")
             return result
         
         # Check maximum length
-        if result['character_count'] > 10000:
+        if character_count > 10000:
             result['warnings'].append("Job description is very long and may slow processing")
         
         # Check for common issues
-        if len(text) < 50:
+        if character_count < 50:
             result['warnings'].append("Job description seems very short")
         
         # Check for potential formatting issues
@@ -196,67 +440,95 @@ def validate_job_description(text: str) -> Dict[str, Any]:
     return result
 
 
-def validate_keyword(keyword: str) -> Dict[str, Any]:
+def _validate_keyword_fast(keyword: str) -> _KeywordResult:
     """
-    Validate a keyword for processing.
+    Validate a keyword without building a result dict.
     
     Args:
         keyword (str): Keyword to validate
         
     Returns:
-        Dict[str, Any]: Validation results with details
+        _KeywordResult: Validity, cleaned keyword, and tuples of errors and warnings
     """
-    result = {
-        'valid': False,
-        'errors': [],
-        'warnings': [],
-        'cleaned': keyword
-    }
-    
     try:
         if not keyword or not keyword.strip():
-            result['errors'].append("Keyword is empty")
-            return result
+            return _KeywordResult(False, keyword, ("Keyword is empty",), ())
         
         # Clean the keyword
         cleaned = keyword.strip()
-        result['cleaned'] = cleaned
         
         # Check length
         if len(cleaned) < MIN_KEYWORD_LENGTH:
-            result['errors'].append(f"Keyword too short (minimum {MIN_KEYWORD_LENGTH} characters)")
-            return result
+            return _KeywordResult(False, cleaned, (f"Keyword too short (minimum {MIN_KEYWORD_LENGTH} characters)",), ())
         
         if len(cleaned) > MAX_KEYWORD_LENGTH:
-            result['errors'].append(f"Keyword too long (maximum {MAX_KEYWORD_LENGTH} characters)")
-            return result
+            return _KeywordResult(False, cleaned, (f"Keyword too long (maximum {MAX_KEYWORD_LENGTH} characters)",), ())
+        
+        warnings = ()
         
         # Check for invalid characters
-        invalid_chars = re.findall(r'[^\w\s\-\.\,\;\:\!\?\(\)\[\]\{\}]', cleaned)
-        if invalid_chars:
-            result['warnings'].append(f"Contains special characters: {set(invalid_chars)}")
+        if _INVALID_KW_RE.search(cleaned):
+            invalid_chars = set(_INVALID_KW_RE.findall(cleaned))
+            warnings += (f"Contains special characters: {invalid_chars}",)
         
         # Check for common issues
         if cleaned.isdigit():
-            result['warnings'].append("Keyword consists only of numbers")
+            warnings += ("Keyword consists only of numbers",)
         
         if len(cleaned.split()) > 5:
-            result['warnings'].append("Keyword is very long (consider breaking into multiple keywords)")
+            warnings += ("Keyword is very long (consider breaking into multiple keywords)",)
         
-        result['valid'] = True
+        return _KeywordResult(True, cleaned, (), warnings)
         
     except Exception as e:
-        result['errors'].append(f"Validation error: {str(e)}")
+        return _KeywordResult(False, keyword, (f"Validation error: {str(e)}",), ())
+
+
+def validate_keyword(keyword: str) -> Dict[str, Any]:
+    """
+    Validate a keyword for processing.
     
-    return result
+    Args:
+        keyword (str): Keyword to validate
+        
+    Returns:
+        Dict[str, Any]: Validation results with details
+    """
+    valid, cleaned, errors, warnings = _validate_keyword_fast(keyword)
+    return {
+        'valid': valid,
+        'errors': list(errors),
+        'warnings': list(warnings),
+        'cleaned': cleaned
+    }
+
+
+def _clean_valid_keyword(keyword: str) -> Optional[str]:
+    """
+    Return the stripped keyword if validate_keyword would accept it.
+    
+    Args:
+        keyword (str): Keyword to validate
+        
+    Returns:
+        Optional[str]: Cleaned keyword if it is valid, None otherwise
+    """
+    if not isinstance(keyword, str):
+        return None
+    cleaned = keyword.strip()
+    if MIN_KEYWORD_LENGTH <= len(cleaned) <= MAX_KEYWORD_LENGTH:
+        return cleaned
+    return None
 
 
-def validate_keyword_list(keywords: List[str]) -> Dict[str, Any]:
+def validate_keyword_list(keywords: List[str], collect_errors: bool = True) -> Dict[str, Any]:
     """
     Validate a list of keywords.
     
     Args:
         keywords (List[str]): List of keywords to validate
+        collect_errors (bool): Whether to list each invalid keyword with its
+            errors; pass False when only the valid keywords are needed
         
     Returns:
         Dict[str, Any]: Validation results with details
@@ -277,16 +549,18 @@ def validate_keyword_list(keywords: List[str]) -> Dict[str, Any]:
             return result
         
         # Validate each keyword
-        for keyword in keywords:
-            validation = validate_keyword(keyword)
-            if validation['valid']:
-                result['valid_keywords'].append(validation['cleaned'])
-                result['valid_count'] += 1
-            else:
-                result['invalid_keywords'].append({
-                    'keyword': keyword,
-                    'errors': validation['errors']
-                })
+        cleaned = [_clean_valid_keyword(keyword) for keyword in keywords]
+        valid_keywords = [keyword for keyword in cleaned if keyword is not None]
+        result['valid_keywords'] = valid_keywords
+        result['valid_count'] = len(valid_keywords)
+        invalid_count = len(keywords) - len(valid_keywords)
+        
+        # Full error details only for the keywords that failed
+        if collect_errors and invalid_count:
+            result['invalid_keywords'] = [
+                {'keyword': keyword, 'errors': list(_validate_keyword_fast(keyword).errors)}
+                for keyword, kept in zip(keywords, cleaned) if kept is None
+            ]
         
         # Check overall validity
         if result['valid_count'] == 0:
@@ -294,7 +568,7 @@ def validate_keyword_list(keywords: List[str]) -> Dict[str, Any]:
             return result
         
         if result['valid_count'] < len(keywords) * 0.8:
-            result['warnings'].append(f"Many invalid keywords ({len(result['invalid_keywords'])} out of {len(keywords)})")
+            result['warnings'].append(f"Many invalid keywords ({invalid_count} out of {len(keywords)})")
         
         result['valid'] = True
         
@@ -304,6 +578,76 @@ def validate_keyword_list(keywords: List[str]) -> Dict[str, Any]:
     return result
 
 
+def _range_validator(low, high, types, message: str):
+    """
+    Build a settings check for a number within an inclusive range.
+    
+    Args:
+        low: Smallest accepted value
+        high: Largest accepted value
+        types: Type or tuple of types the value must be an instance of
+        message (str): Error reported for a rejected value
+        
+    Returns:
+        Callable: Check returning (ok, value_or_error)
+    """
+    def check(value):
+        if not isinstance(value, types) or value < low or value > high:
+            return False, message
+        return True, value
+    return check
+
+
+def _bool_validator(message: str):
+    """
+    Build a settings check for a boolean flag.
+    
+    Args:
+        message (str): Error reported for a rejected value
+        
+    Returns:
+        Callable: Check returning (ok, value_or_error)
+    """
+    def check(value):
+        if not isinstance(value, bool):
+            return False, message
+        return True, value
+    return check
+
+
+def _enum_validator(choices: List[Any], message: str):
+    """
+    Build a settings check for a value from a fixed set of choices.
+    
+    Args:
+        choices (List[Any]): Accepted values
+        message (str): Error reported for a rejected value
+        
+    Returns:
+        Callable: Check returning (ok, value_or_error)
+    """
+    def check(value):
+        if value not in choices:
+            return False, message
+        return True, value
+    return check
+
+
+_VALID_THEMES = ['light', 'dark', 'system']
+
+# (setting name, default, check) in the order validate_settings reports errors
+_SETTINGS_SPEC = (
+    ('fuzzy_threshold', 70,
+     _range_validator(0, 100, (int, float), "Fuzzy threshold must be between 0 and 100")),
+    ('max_keywords', 100,
+     _range_validator(10, 1000, int, "Max keywords must be between 10 and 1000")),
+    ('use_spacy', True, _bool_validator("use_spacy must be a boolean")),
+    ('theme', 'light',
+     _enum_validator(_VALID_THEMES, f"Theme must be one of: {_VALID_THEMES}")),
+    ('auto_save', True, _bool_validator("auto_save must be a boolean")),
+)
+
+
 def validate_settings(settings: Dict[str, Any]) -> Dict[str, Any]:
     """
     Validate application settings.
@@ -322,43 +666,16 @@ def validate_settings(settings: Dict[str, Any]) -> Dict[str, Any]:
     }
     
     try:
-        # Validate fuzzy threshold
-        fuzzy_threshold = settings.get('fuzzy_threshold', 70)
-        if not isinstance(fuzzy_threshold, (int, float)) or fuzzy_threshold < 0 or fuzzy_threshold > 100:
-            result['errors'].append("Fuzzy threshold must be between 0 and 100")
-        else:
-            result['validated_settings']['fuzzy_threshold'] = fuzzy_threshold
-        
-        # Validate max keywords
-        max_keywords = settings.get('max_keywords', 100)
-        if not isinstance(max_keywords, int) or max_keywords < 10 or max_keywords > 1000:
-            result['errors'].append("Max keywords must be between 10 and 1000")
-        else:
-            result['validated_settings']['max_keywords'] = max_keywords
-        
-        # Validate use_spacy
-        use_spacy = settings.get('use_spacy', True)
-        if not isinstance(use_spacy, bool):
-            result['errors'].append("use_spacy must be a boolean")
-        else:
-            result['validated_settings']['use_spacy'] = use_spacy
-        
-        # Validate theme
-        theme = settings.get('theme', 'light')
-        valid_themes = ['light', 'dark', 'system']
-        if theme not in valid_themes:
-            result['errors'].append(f"Theme must be one of: {valid_themes}")
-        else:
-            result['validated_settings']['theme'] = theme
-        
-        # Validate auto_save
-        auto_save = settings.get('auto_save', True)
-        if not isinstance(auto_save, bool):
-            result['errors'].append("auto_save must be a boolean")
-        else:
-            result['validated_settings']['auto_save'] = auto_save
+        errors = result['errors']
+        validated = result['validated_settings']
+        for name, default, check in _SETTINGS_SPEC:
+            ok, value = check(settings.get(name, default))
+            if ok:
+                validated[name] = value
+            else:
+                errors.append(value)
         
-        if not result['errors']:
+        if not errors:
             result['valid'] = True
         
     except Exception as e:
@@ -377,10 +694,8 @@ def sanitize_filename(filename: str) -> str:
     Returns:
         str: Sanitized filename
     """
-    # Remove or replace invalid characters
-    invalid_chars = '<>:"/\\|?*'
-    for char in invalid_chars:
-        filename = filename.replace(char, '_')
+    # Replace invalid characters in a single pass
+    filename = filename.translate(FILENAME_SANITIZE_TABLE)
     
     # Remove leading/trailing spaces and dots
     filename = filename.strip(' .')
@@ -390,10 +705,7 @@ def sanitize_filename(filename: str) -> str:
         filename = 'untitled'
     
     # Limit length
-    if len(filename) > 255:
-        filename = filename[:255]
-    
-    return filename
+    return filename[:255]
 
 
 def validate_directory_path(dir_path: Union[str, Path]) -> Dict[str, Any]:
@@ -426,15 +738,11 @@ def validate_directory_path(dir_path: Union[str, Path]) -> Dict[str, Any]:
                 result['errors'].append("Path exists but is not a directory")
                 return result
             
-            # Check if it's writable
-            try:
-                test_file = path / '.test_write'
-                test_file.touch()
-                test_file.unlink()
-                result['writable'] = True
-            except Exception:
+            # Check if it's writable, without creating a probe file
+            if not os.access(path, os.W_OK, effective_ids=_ACCESS_EFFECTIVE_IDS):
                 result['errors'].append("Directory is not writable")
                 return result
+            result['writable'] = True
         else:
             # Try to create directory
             try:
@@ -468,8 +776,7 @@ def validate_email(email: str) -> bool:
         return False
     
     # Basic email regex pattern
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return bool(re.match(pattern, email))
+    return bool(_EMAIL_RE.match(email))
 
 
 def validate_url(url: str) -> bool:
@@ -486,8 +793,45 @@ def validate_url(url: str) -> bool:
         return False
     
     # Basic URL regex pattern
-    pattern = r'^https?://[^\s/$.?#].[^\s]*$'
-    return bool(re.match(pattern, url))
+    return bool(_URL_RE.match(url))
+
+
+def _check_jsonable(data: Any, active: Optional[set] = None) -> None:
+    """
+    Raise the errors json.dumps would raise for data, without encoding it.
+    
+    Args:
+        data (Any): Data to check
+        active (set, optional): ids of the containers being walked, for cycle detection
+        
+    Raises:
+        TypeError: If data contains a value or key json cannot encode
+        ValueError: If data contains a circular reference
+    """
+    if isinstance(data, _JSON_ATOMIC):
+        return
+    if not isinstance(data, (dict, list, tuple)):
+        raise TypeError(f"Object of type {type(data).__name__} is not JSON serializable")
+    
+    if active is None:
+        active = set()
+    marker = id(data)
+    if marker in active:
+        raise ValueError("Circular reference detected")
+    active.add(marker)
+    
+    if isinstance(data, dict):
+        for key, value in data.items():
+            if not isinstance(key, _JSON_ATOMIC):
+                raise TypeError(
+                    f"keys must be str, int, float, bool or None, not {type(key).__name__}"
+                )
+            _check_jsonable(value, active)
+    else:
+        for item in data:
+            _check_jsonable(item, active)
+    
+    active.discard(marker)
 
 
 def validate_json_data(data: Any) -> Dict[str, Any]:
@@ -508,9 +852,8 @@ def validate_json_data(data: Any) -> Dict[str, Any]:
     }
     
     try:
-        # Check if data is JSON-serializable
-        import json
-        json.dumps(data)
+        # Check if data is JSON-serializable without encoding it
+        _check_jsonable(data)
         
         # Additional validation based on data type
         if isinstance(data, dict):
@@ -0,0 +1,237 @@
+"""
+Helper Tests for EasyApply
+
+Tests for the cached and accelerated paths in the helper utilities.
+"""
+
+import pytest
+import os
+import random
+import sys
+from datetime import datetime
+from enum import Enum
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+
+def test_json_cache_invalidated_by_save(tmp_path):
+    """Test that load_json_data sees data written by save_json_data."""
+    from src.utils.helpers import save_json_data, load_json_data
+    
+    path = tmp_path / "data.json"
+    assert save_json_data({"version": 1}, path)
+    assert load_json_data(path) == {"version": 1}
+    
+    # Same size and possibly the same mtime; the save must still invalidate
+    assert save_json_data({"version": 2}, path)
+    assert load_json_data(path) == {"version": 2}
+
+
+def test_json_cache_returns_independent_copies(tmp_path):
+    """Test that mutating loaded data does not change later loads."""
+    from src.utils.helpers import save_json_data, load_json_data
+    
+    path = tmp_path / "data.json"
+    assert save_json_data({"keywords": ["python"], "settings": {"theme": "light"}}, path)
+    
+    first = load_json_data(path)
+    first["keywords"].append("sql")
+    first["settings"]["theme"] = "dark"
+    
+    assert load_json_data(path) == {"keywords": ["python"], "settings": {"theme": "light"}}
+
+
+def test_group_similar_keywords_matches_pairwise_similarity():
+    """Test grouping against a direct pairwise calculate_similarity scan."""
+    from src.utils.helpers import group_similar_keywords, calculate_similarity
+    
+    keywords = ["Python", "python programming", "Data Science", "data", "science data", "", "SQL", "sql"]
+    
+    expected = []
+    used = set()
+    for i, keyword1 in enumerate(keywords):
+        if i in used:
+            continue
+        group = [keyword1]
+        used.add(i)
+        for j in range(i + 1, len(keywords)):
+            if j not in used and calculate_similarity(keyword1, keywords[j]) >= 0.5:
+                group.append(keywords[j])
+                used.add(j)
+        expected.append(group)
+    
+    assert group_similar_keywords(keywords, 0.5) == expected
+
+
+def test_json_round_trip(tmp_path):
+    """Test that saved JSON loads back with the values json.dumps would write."""
+    from src.utils.helpers import save_json_data, load_json_data
+    
+    path = tmp_path / "data.json"
+    data = {
+        "text": "résumé",
+        "big": 2 ** 70,
+        "ratio": 0.1,
+        "nested": {"items": [1, None, True]},
+        "created": datetime(2024, 1, 2, 3, 4, 5),
+        1: "int key",
+    }
+    assert save_json_data(data, path)
+    
+    loaded = load_json_data(path)
+    assert loaded["text"] == "résumé"
+    assert loaded["big"] == 2 ** 70
+    assert loaded["ratio"] == 0.1
+    assert loaded["nested"] == {"items": [1, None, True]}
+    assert loaded["created"] == "2024-01-02 03:04:05"
+    assert loaded["1"] == "int key"
+
+
+def test_json_encoding_matches_stdlib(monkeypatch):
+    """Test that the orjson and json save paths write identical bytes."""
+    from src.utils import helpers
+    
+    class Theme(Enum):
+        LIGHT = "light"
+    
+    payloads = [
+        {"theme": Theme.LIGHT, "count": 3},
+        {"values": [0.1, 1e300, 5e-05, -0.0, 1e16, float("nan"), float("inf")]},
+        {"big": 2 ** 64, "small": -(2 ** 63), "nested": [{"a": (1, 2)}, [], {}]},
+        {1: "int key", None: "null key", "text": "r\u00e9sum\u00e9\n\t\u2028"},
+        {"created": datetime(2024, 1, 2, 3, 4, 5)},
+    ]
+    
+    for data in payloads:
+        monkeypatch.setattr(helpers, "ORJSON_AVAILABLE", False)
+        expected = helpers._encode_json(data, 2)
+        monkeypatch.undo()
+        assert helpers._encode_json(data, 2) == expected
+
+
+def test_group_similar_keywords_sparse_matches_indexed(monkeypatch):
+    """Test that the sparse and indexed grouping paths give the same groups."""
+    pytest.importorskip("scipy")
+    from src.utils import helpers
+    
+    rng = random.Random(0)
+    vocabulary = ["python", "data", "machine", "learning", "cloud", "aws", "sql", "api", "design", "c++"]
+    keywords = [
+        " ".join(rng.sample(vocabulary, rng.randint(1, 3)))
+        for _ in range(helpers._SPARSE_JACCARD_MIN_KEYWORDS + 50)
+    ] + ["", "!!!", "???"]
+    
+    for threshold in (0.3, 0.5, 0.8, 1.0):
+        monkeypatch.setattr(helpers, "_SPARSE_JACCARD_MIN_KEYWORDS", len(keywords) + 1)
+        indexed = helpers.group_similar_keywords(keywords, threshold)
+        monkeypatch.setattr(helpers, "_SPARSE_JACCARD_MIN_KEYWORDS", 1)
+        sparse = helpers.group_similar_keywords(keywords, threshold)
+        assert sparse == indexed
+
+
+def test_format_file_size_boundaries():
+    """Test unit boundaries and non-finite input against a division loop."""
+    from src.utils.helpers import format_file_size
+    
+    def reference(size_bytes):
+        if size_bytes == 0:
+            return "0 B"
+        units = ["B", "KB", "MB", "GB", "TB"]
+        i = 0
+        while size_bytes >= 1024 and i < len(units) - 1:
+            size_bytes /= 1024.0
+            i += 1
+        return f"{size_bytes:.1f} {units[i]}"
+    
+    assert format_file_size(0) == "0 B"
+    assert format_file_size(1023) == "1023.0 B"
+    assert format_file_size(1024) == "1.0 KB"
+    assert format_file_size(2 ** 50 - 1) == "1024.0 TB"
+    assert format_file_size(2 ** 50) == "1024.0 TB"
+    
+    sizes = [1, 1023.5, 1024.0, 2 ** 20 - 1, 2 ** 20, 2 ** 30, 2 ** 40 - 1, 2 ** 40, 2 ** 60, -5,
+             float("nan"), float("inf"), float("-inf")]
+    sizes += [2 ** shift + delta for shift in range(10, 51, 10) for delta in (-1, 0, 1)]
+    for size in sizes:
+        assert format_file_size(size) == reference(size)
+
+
+def test_get_file_hash_paths_agree(tmp_path, monkeypatch):
+    """Test that the mmap, file_digest and chunked hashing paths give the same digest."""
+    import hashlib
+    from src.utils import helpers
+    
+    data = random.Random(0).randbytes(3 * helpers._HASH_CHUNK_SIZE + 123)
+    path = tmp_path / "resume.pdf"
+    path.write_bytes(data)
+    expected = hashlib.sha256(data).hexdigest()
+    
+    # Default path: file_digest where available
+    assert helpers.get_file_hash(path) == expected
+    
+    # Chunked read loop
+    with monkeypatch.context() as patch:
+        patch.delattr(hashlib, "file_digest", raising=False)
+        assert helpers.get_file_hash(path) == expected
+    
+    # Memory-mapped path
+    monkeypatch.setattr(helpers, "_MMAP_HASH_THRESHOLD", 1024)
+    assert helpers.get_file_hash(path) == expected
+    
+    assert helpers.get_file_hash(tmp_path / "missing.pdf") is None
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="kernel copy is Linux only")
+def test_create_backup_falls_back_on_failed_kernel_copy(tmp_path, monkeypatch):
+    """Test that backups keep every byte when FICLONE or copy_file_range fall short."""
+    import fcntl
+    from src.utils import helpers
+    
+    data = random.Random(1).randbytes(100_000)
+    source = tmp_path / "resume.pdf"
+    source.write_bytes(data)
+    
+    def no_clone(*args):
+        raise OSError("FICLONE not supported")
+    
+    monkeypatch.setattr(fcntl, "ioctl", no_clone)
+    real_copy_file_range = os.copy_file_range
+    
+    def short_copy(src, dst, count, *args):
+        # Copy a little, then report end of file early
+        if os.fstat(dst).st_size == 0:
+            return real_copy_file_range(src, dst, 10)
+        return 0
+    
+    def failing_copy(*args):
+        raise OSError("copy_file_range not supported")
+    
+    for copy in (real_copy_file_range, short_copy, failing_copy):
+        monkeypatch.setattr(os, "copy_file_range", copy)
+        backup = helpers.create_backup(source, str(tmp_path / copy.__name__))
+        assert backup is not None
+        assert Path(backup).read_bytes() == data
+    
+    monkeypatch.setattr(os, "copy_file_range", short_copy)
+    assert not helpers._clone_file(source, tmp_path / "partial.pdf")
+
+
+@pytest.mark.skipif(not Path("/proc/self/status").exists(), reason="needs /proc")
+def test_create_backup_copies_files_reporting_zero_size(tmp_path):
+    """Test that files whose size reads as 0 but have contents are fully copied."""
+    from src.utils.helpers import create_backup
+    
+    backup = create_backup("/proc/self/status", str(tmp_path / "backups"))
+    assert backup is not None
+    assert Path(backup).read_bytes().startswith(b"Name:")
+    
+    empty = tmp_path / "empty.txt"
+    empty.write_bytes(b"")
+    backup = create_backup(empty, str(tmp_path / "backups"))
+    assert Path(backup).read_bytes() == b""
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,127 @@
+"""
+Logger Tests for EasyApply
+
+Tests for deferred logging setup.
+"""
+
+import pytest
+import logging
+import sys
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+
+@pytest.fixture
+def logger_module(monkeypatch):
+    """Give each test fresh logging state and restore the root logger afterwards."""
+    from src.utils import logger as module
+    
+    root = logging.getLogger()
+    saved_handlers = root.handlers[:]
+    saved_level = root.level
+    monkeypatch.setattr(module, "_pending_config", None)
+    monkeypatch.setattr(module, "_configured", False)
+    monkeypatch.setattr(module, "_handlers", [])
+    
+    yield module
+    
+    for handler in module._handlers:
+        handler.close()
+    root.handlers = saved_handlers
+    root.setLevel(saved_level)
+
+
+def _own_handlers(module):
+    """Return the root handlers that setup_logging installed."""
+    return [h for h in logging.getLogger().handlers if h in module._handlers]
+
+
+def test_setup_logging_is_deferred(logger_module, tmp_path):
+    """Test that handlers are built on the first record, which is logged once."""
+    log_file = tmp_path / "logs" / "app.log"
+    
+    logger_module.setup_logging(log_file=log_file)
+    assert not log_file.parent.exists()
+    assert len(_own_handlers(logger_module)) == 1
+    
+    logging.getLogger("test").warning("first record")
+    logging.getLogger("test").warning("second record")
+    assert len(_own_handlers(logger_module)) == 2
+    
+    contents = log_file.read_text()
+    assert contents.count("first record") == 1
+    assert contents.count("second record") == 1
+    assert contents.index("first record") < contents.index("Logging initialized")
+
+
+def test_setup_logging_is_idempotent(logger_module, tmp_path):
+    """Test that repeating setup_logging with the same settings adds no handlers."""
+    log_file = tmp_path / "app.log"
+    
+    logger_module.setup_logging(log_file=log_file)
+    logger_module.setup_logging(log_file=log_file)
+    logger_module.setup_logging()
+    logging.getLogger("test").warning("only once")
+    logger_module.setup_logging(log_file=log_file)
+    
+    assert len(_own_handlers(logger_module)) == 2
+    assert log_file.read_text().count("only once") == 1
+
+
+def test_setup_logging_leaves_other_handlers_alone(logger_module, tmp_path):
+    """Test that the first record reaches handlers added by other code once."""
+    class RecordingHandler(logging.Handler):
+        def __init__(self):
+            super().__init__()
+            self.messages = []
+        
+        def emit(self, record):
+            self.messages.append(record.getMessage())
+    
+    other = RecordingHandler()
+    logging.getLogger().addHandler(other)
+    
+    logger_module.setup_logging(log_file=tmp_path / "app.log")
+    logging.getLogger("test").warning("first record")
+    
+    assert other.messages.count("first record") == 1
+    assert other in logging.getLogger().handlers
+
+
+def test_setup_logging_replaces_handlers(logger_module, tmp_path):
+    """Test that new settings replace the handlers of an earlier call."""
+    first = tmp_path / "first.log"
+    second = tmp_path / "second.log"
+    
+    logger_module.setup_logging(log_file=first)
+    logging.getLogger("test").warning("to first")
+    logger_module.setup_logging(log_file=second)
+    logging.getLogger("test").warning("to second")
+    
+    assert len(_own_handlers(logger_module)) == 2
+    assert "to second" not in first.read_text()
+    assert "to second" in second.read_text()
+
+
+def test_failing_log_path_does_not_raise(logger_module, tmp_path):
+    """Test that an unusable log directory falls back to console logging."""
+    blocker = tmp_path / "not_a_directory"
+    blocker.write_text("")
+    
+    logger_module.setup_logging(log_file=blocker / "sub" / "app.log")
+    logging.getLogger("test").warning("first record")
+    logging.getLogger("test").warning("second record")
+    
+    handlers = _own_handlers(logger_module)
+    assert len(handlers) == 1
+    assert isinstance(handlers[0], logging.StreamHandler)
+    assert not any(
+        isinstance(h, logger_module._DeferredSetupHandler)
+        for h in logging.getLogger().handlers
+    )
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,55 @@
+"""
+Style Tests for EasyApply
+
+Tests for the stylesheet rule index used for partial theme updates.
+"""
+
+import pytest
+import sys
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+pytest.importorskip("PySide6")
+
+
+def test_rule_blocks_cover_template():
+    """Test that the rule blocks concatenate back to the full template."""
+    from src.gui import styles
+    
+    joined = "".join(styles._RULE_BLOCKS)
+    assert styles._APPLICATION_TEMPLATE.startswith(joined)
+    assert styles._APPLICATION_TEMPLATE[len(joined):].strip() == ""
+    assert all(block.rstrip().endswith("}}") for block in styles._RULE_BLOCKS)
+
+
+def test_style_delta_contains_only_changed_color_rules():
+    """Test that changing one color returns exactly the blocks that use it."""
+    from src.gui import styles
+    from src.utils.constants import COLORS
+    
+    new_palette = {'primary': '#123456'}
+    delta = styles.get_style_delta({}, new_palette)
+    
+    colors = {**COLORS, **new_palette}
+    expected = "".join(
+        block.format_map(colors) for block in styles._RULE_BLOCKS if "{primary}" in block
+    )
+    assert delta
+    assert delta == expected
+    assert '#123456' in delta
+
+
+def test_style_delta_empty_for_unchanged_or_unknown_keys():
+    """Test that unchanged and unknown palette keys produce no delta."""
+    from src.gui.styles import get_style_delta
+    from src.utils.constants import COLORS
+    
+    assert get_style_delta({}, {}) == ""
+    assert get_style_delta({}, {'primary': COLORS['primary']}) == ""
+    assert get_style_delta({}, {'not_a_color_key': '#123456'}) == ""
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
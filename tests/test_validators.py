@@ -0,0 +1,137 @@
+"""
+Validator Tests for EasyApply
+
+Tests for the cached and accelerated paths in the validation utilities.
+"""
+
+import pytest
+import os
+import random
+import subprocess
+import sys
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+
+def test_pdf_missing_file_errors(tmp_path):
+    """Test that unreachable paths are reported as missing, as Path.exists() would."""
+    from src.utils.validators import validate_pdf_file
+    
+    loop = tmp_path / "loop.pdf"
+    loop.symlink_to(loop)
+    blocker = tmp_path / "notes.txt"
+    blocker.write_text("notes")
+    
+    for path in [tmp_path / "missing.pdf", loop, blocker / "resume.pdf", str(tmp_path / "bad\0.pdf")]:
+        result = validate_pdf_file(path)
+        assert not result['valid']
+        assert result['errors'] == ["File does not exist"]
+
+
+def test_count_words_matches_split():
+    """Test that _count_words agrees with str.split on long and short text."""
+    from src.utils.validators import _count_words, _NUMPY_WORD_COUNT_MIN_CHARS
+    
+    rng = random.Random(0)
+    alphabet = "ab. \t\n\r\x0b\x0c\x1c\x1d\x1e\x1f"
+    for _ in range(50):
+        length = rng.randint(1, _NUMPY_WORD_COUNT_MIN_CHARS * 2)
+        text = "".join(rng.choice(alphabet) for _ in range(length))
+        assert _count_words(text) == len(text.split())
+    
+    # Edge cases around the byte scan, plus Unicode whitespace
+    size = _NUMPY_WORD_COUNT_MIN_CHARS
+    for text in ["a" * size, " " * size, "a" + " " * size, " " * size + "a", "word\u00a0word " * size,
+                 "caf\u00e9\u2003menu " * size]:
+        assert _count_words(text) == len(text.split())
+
+
+def test_count_words_does_not_import_numpy_for_short_text():
+    """Test that importing validators and counting short text leaves numpy unloaded."""
+    code = (
+        "import sys; sys.path.insert(0, '.');"
+        "from src.utils.validators import _count_words;"
+        "assert _count_words('a few words') == 3;"
+        "assert 'numpy' not in sys.modules"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True, cwd=Path(__file__).parent.parent)
+
+
+def test_validate_keyword_list_details():
+    """Test that keyword list validation reports the same errors as validate_keyword."""
+    from src.utils.validators import validate_keyword, validate_keyword_list
+    
+    keywords = ["python", "  sql  ", "", "a", "x" * 200, "c++"]
+    result = validate_keyword_list(keywords)
+    
+    assert result['valid_keywords'] == ["python", "sql", "c++"]
+    assert result['invalid_keywords'] == [
+        {'keyword': keyword, 'errors': validate_keyword(keyword)['errors']}
+        for keyword in ["", "a", "x" * 200]
+    ]
+
+
+def _rewrite(path, content):
+    """Rewrite a file and move its mtime forward so the change is visible."""
+    st = path.stat()
+    path.write_bytes(content)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+def test_pdf_verdict_cache_invalidated_on_rewrite(tmp_path):
+    """Test that a cached PDF verdict is dropped when the file changes."""
+    from src.utils.validators import validate_pdf_file
+    
+    path = tmp_path / "resume.pdf"
+    path.write_bytes(b"%PDF-1.4 test")
+    assert validate_pdf_file(path)['valid']
+    assert validate_pdf_file(path)['valid']
+    
+    # Same size, different signature
+    _rewrite(path, b"%PDX-1.4 test")
+    result = validate_pdf_file(path)
+    assert not result['valid']
+    assert result['errors'] == ["File does not appear to be a valid PDF"]
+    
+    _rewrite(path, b"%PDF-1.4 test")
+    assert validate_pdf_file(path)['valid']
+
+
+def test_validate_settings():
+    """Test settings validation messages and defaults."""
+    from src.utils.validators import validate_settings
+    
+    result = validate_settings({})
+    assert result['valid']
+    assert result['validated_settings'] == {
+        'fuzzy_threshold': 70, 'max_keywords': 100, 'use_spacy': True,
+        'theme': 'light', 'auto_save': True
+    }
+    
+    result = validate_settings({'fuzzy_threshold': 101, 'theme': 'blue', 'auto_save': 1})
+    assert not result['valid']
+    assert result['errors'] == [
+        "Fuzzy threshold must be between 0 and 100",
+        "Theme must be one of: ['light', 'dark', 'system']",
+        "auto_save must be a boolean",
+    ]
+
+
+def test_pdf_file_from_entry_matches_path(tmp_path):
+    """Test that scandir entries validate the same as their paths."""
+    from src.utils.validators import validate_pdf_file, validate_pdf_file_from_entry
+    
+    (tmp_path / "resume.pdf").write_bytes(b"%PDF-1.4")
+    (tmp_path / "fake.pdf").write_bytes(b"not a pdf")
+    (tmp_path / "notes.txt").write_text("notes")
+    (tmp_path / "folder.pdf").mkdir()
+    
+    with os.scandir(tmp_path) as entries:
+        for entry in entries:
+            assert validate_pdf_file_from_entry(entry) == validate_pdf_file(entry.path)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])